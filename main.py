@@ -4,16 +4,27 @@ import sys
 import os
 from PySide6.QtWidgets import QApplication, QDialog
 
-from src.ui.styles import DARK_STYLESHEET
-from src.ui.main_window import GlimpseViewer
+from src.ui.styles import apply_global_style
 from src.ui.startup_dialog import StartupDialog
 from PySide6.QtGui import QIcon
 
 
+def _create_viewer():
+    """Create the main viewer window.
+
+    The viewer module pulls in the image pipeline (TurboJPEG, numpy and the
+    optional numba kernel), so it is imported only once the user has picked
+    something to view rather than before the startup dialog can appear.
+    """
+    from src.ui.main_window import GlimpseViewer
+
+    return GlimpseViewer()
+
+
 def main():
     """Main application entry point with startup dialog."""
     app = QApplication(sys.argv)
-    app.setStyleSheet(DARK_STYLESHEET)
+    apply_global_style(app)
     # Get the directory where the script/executable is located
     if getattr(sys, "frozen", False):
         # Running as compiled executable
@@ -42,9 +53,8 @@ def main():
         if not data or len(data) != 3:
             return
         collection, timer_enabled, timer_interval = data
-        viewer = GlimpseViewer()
-        viewer.show()
-        viewer.center_on_screen()
+        viewer = _create_viewer()
+        viewer.show()  # Centers itself on first show
         viewer.load_collection(collection, timer_enabled, timer_interval)
 
     def on_folder_selected(data):
@@ -52,9 +62,8 @@ def main():
         if not data or len(data) != 3:
             return
         folder, timer_enabled, timer_interval = data
-        viewer = GlimpseViewer()
-        viewer.show()
-        viewer.center_on_screen()
+        viewer = _create_viewer()
+        viewer.show()  # Centers itself on first show
         viewer.load_folder(folder, timer_enabled, timer_interval)
 
     startup.collection_selected.connect(on_collection_selected)
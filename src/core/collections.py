@@ -2,12 +2,14 @@
 
 import os
 import json
+import random
 import re
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from PySide6.QtCore import QStandardPaths
 
-from .image_utils import get_images_in_folder
+from .image_utils import IMAGE_SUFFIXES, get_images_in_folder
 
 
 class Collection:
@@ -27,9 +29,14 @@ class Collection:
         self.paths = paths
         self.created_date = created_date or datetime.now().isoformat()
         self.last_used = last_used
+        # Persisted with the collection and read back verbatim; it is only
+        # recounted on explicit create/edit, never when collections load
         self.image_count = image_count
         self.sort_method = sort_method  # "random", "name", "path", "size", "date"
         self.sort_descending = sort_descending
+        # Rendered details-panel HTML, filled in lazily by the UI; reset to
+        # None whenever a displayed field changes
+        self.details_html: Optional[str] = None
 
     def to_dict(self) -> Dict:
         """Convert collection to dictionary for JSON serialization."""
@@ -69,8 +76,6 @@ class Collection:
         images = self.get_all_images()
 
         if self.sort_method == "random":
-            import random
-
             random.shuffle(images)
         elif self.sort_method == "name":
 
@@ -132,12 +137,18 @@ class Collection:
         return images
 
     def update_image_count(self):
-        """Update the cached image count."""
+        """Recount the images on disk and update the cached image count.
+
+        Walks every folder in the collection, so it is only called when the
+        user creates or edits a collection; loading relies on the saved count.
+        """
         self.image_count = len(self.get_all_images())
+        self.details_html = None
 
     def mark_as_used(self):
         """Mark collection as recently used."""
         self.last_used = datetime.now().isoformat()
+        self.details_html = None
 
 
 class CollectionManager:
@@ -146,6 +157,9 @@ class CollectionManager:
     def __init__(self):
         self.collections_dir = self._get_collections_dir()
         self._ensure_collections_dir()
+        # Parsed collections keyed by file name, with the file's mtime when
+        # parsed; files are only re-read when their mtime changes
+        self._cache: Dict[str, Tuple[float, Collection]] = {}
 
     def _get_collections_dir(self) -> str:
         """Get the collections directory path."""
@@ -158,6 +172,47 @@ class CollectionManager:
         """Ensure collections directory exists."""
         os.makedirs(self.collections_dir, exist_ok=True)
 
+    @staticmethod
+    def count_images_fast(
+        folders: List[str], budget_entries: int = 500, budget_ms: float = 50
+    ) -> Tuple[int, bool]:
+        """Count images under folders within a small entry and time budget.
+
+        Stops after budget_entries directory entries or budget_ms
+        milliseconds, whichever comes first; the clock is checked per
+        directory, so slow network shares give up early too.
+
+        Returns (count, complete). When complete is False the budget ran out
+        and count is only a partial tally; callers should fall back to a full
+        background scan.
+        """
+        count = 0
+        seen = 0
+        deadline = time.perf_counter() + budget_ms / 1000
+        pending = [path for path in folders if os.path.isdir(path)]
+        while pending:
+            if time.perf_counter() > deadline:
+                return count, False
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        seen += 1
+                        if seen > budget_entries:
+                            return count, False
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            # Same as os.walk: don't descend into symlinked dirs
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                        elif entry.name.lower().endswith(IMAGE_SUFFIXES):
+                            count += 1
+            except OSError:
+                continue
+        return count, True
+
     def _get_collection_file_path(self, collection_name: str) -> str:
         """Get the file path for a collection."""
         # Sanitize collection name for filename
@@ -172,11 +227,19 @@ class CollectionManager:
             file_path = self._get_collection_file_path(collection.name)
             with open(file_path, "w", encoding="utf-8") as f:
                 json.dump(collection.to_dict(), f, indent=2, ensure_ascii=False)
-            return True
         except Exception as e:
             print(f"Error saving collection '{collection.name}': {e}")
             return False
 
+        # Keep the saved object itself cached so the next listing doesn't
+        # re-parse the file we just wrote
+        try:
+            mtime = os.stat(file_path).st_mtime
+            self._cache[os.path.basename(file_path)] = (mtime, collection)
+        except OSError:
+            self._cache.pop(os.path.basename(file_path), None)
+        return True
+
     def load_collection(self, collection_name: str) -> Optional[Collection]:
         """Load a collection from disk."""
         try:
@@ -192,35 +255,64 @@ class CollectionManager:
             print(f"Error loading collection '{collection_name}': {e}")
             return None
 
+    @staticmethod
+    def _sort_collections(collections: List[Collection]):
+        """Sort in place by last used (most recent first), then by name."""
+        collections.sort(key=lambda c: (c.last_used or "", c.name), reverse=True)
+
     def get_all_collections(self) -> List[Collection]:
-        """Get all available collections."""
+        """Get all available collections.
+
+        Files whose mtime matches the cached entry are served from memory;
+        only new or changed files are parsed. Files removed from disk drop
+        out of the cache. Image counts come from the saved JSON, so this
+        never walks the collections' image folders.
+        """
         collections = []
+        fresh: Dict[str, Tuple[float, Collection]] = {}
         try:
-            for filename in os.listdir(self.collections_dir):
-                if filename.endswith(".json"):
-                    collection_name = filename[:-5]  # Remove .json extension
-                    collection = self.load_collection(collection_name)
-                    if collection:
-                        collections.append(collection)
+            with os.scandir(self.collections_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    cached = self._cache.get(entry.name)
+                    if cached is not None and cached[0] == mtime:
+                        collection = cached[1]
+                    else:
+                        collection_name = entry.name[:-5]  # Remove .json extension
+                        collection = self.load_collection(collection_name)
+                        if not collection:
+                            continue
+                    fresh[entry.name] = (mtime, collection)
+                    collections.append(collection)
         except Exception as e:
             print(f"Error loading collections: {e}")
 
-        # Sort by last used (most recent first), then by name
-        collections.sort(key=lambda c: (c.last_used or "", c.name))
-        collections.reverse()  # Most recent first
+        self._cache = fresh
+        self._sort_collections(collections)
         return collections
 
+    def invalidate_cache(self):
+        """Drop the parsed collections so the next read re-parses every file."""
+        self._cache.clear()
+
     def delete_collection(self, collection_name: str) -> bool:
         """Delete a collection from disk."""
         try:
             file_path = self._get_collection_file_path(collection_name)
             if os.path.exists(file_path):
                 os.remove(file_path)
-            return True
         except Exception as e:
             print(f"Error deleting collection '{collection_name}': {e}")
             return False
 
+        self._cache.pop(os.path.basename(file_path), None)
+        return True
+
     def collection_exists(self, collection_name: str) -> bool:
         """Check if a collection already exists."""
         file_path = self._get_collection_file_path(collection_name)
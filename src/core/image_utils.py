@@ -1,7 +1,9 @@
 """Image processing utilities and helpers."""
 
+import math
 import os
 from PySide6.QtGui import (
+    QGuiApplication,
     QPixmap,
     QPainter,
     QFont,
@@ -11,10 +13,12 @@ from PySide6.QtGui import (
     QBrush,
     QPolygon,
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QRectF
 from PySide6.QtSvg import QSvgRenderer
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif"}
+# Same extensions as a tuple, for str.endswith() on lowercased file names
+IMAGE_SUFFIXES = tuple(sorted(IMAGE_EXTENSIONS))
 
 
 def get_images_in_folder(folder):
@@ -120,6 +124,17 @@ def set_adaptive_bg(image_label, img_path):
         image_label.parentWidget().setStyleSheet("background-color: rgb(40,40,40);")
 
 
+def _icon_scale_factor():
+    """Backing-store scale for icon pixmaps.
+
+    At least 2x so icons stay crisp when a window moves to a HiDPI screen,
+    and never below the application's device pixel ratio.
+    """
+    app = QGuiApplication.instance()
+    dpr = app.devicePixelRatio() if app is not None else 1.0
+    return max(2, math.ceil(dpr))
+
+
 def create_professional_icon(icon_type, size=24, color="#ffffff"):
     """Create icons from SVG files when available, fallback to coded icons."""
     # First try to load from SVG file
@@ -130,8 +145,11 @@ def create_professional_icon(icon_type, size=24, color="#ffffff"):
     )
 
     if os.path.exists(svg_path):
-        # Create icon from SVG
-        pixmap = QPixmap(size, size)
+        # Rasterize the SVG at device resolution so Qt never upscales it
+        scale_factor = _icon_scale_factor()
+        target = QRectF(0, 0, size, size)
+        pixmap = QPixmap(size * scale_factor, size * scale_factor)
+        pixmap.setDevicePixelRatio(scale_factor)
         pixmap.fill(Qt.transparent)
 
         painter = QPainter(pixmap)
@@ -139,12 +157,13 @@ def create_professional_icon(icon_type, size=24, color="#ffffff"):
 
         renderer = QSvgRenderer(svg_path)
         if renderer.isValid():
-            renderer.render(painter)
+            renderer.render(painter, target)
             painter.end()
 
             # If color is different from white, apply color tint
             if color != "#ffffff":
-                colored_pixmap = QPixmap(size, size)
+                colored_pixmap = QPixmap(size * scale_factor, size * scale_factor)
+                colored_pixmap.setDevicePixelRatio(scale_factor)
                 colored_pixmap.fill(Qt.transparent)
 
                 colored_painter = QPainter(colored_pixmap)
@@ -160,14 +179,14 @@ def create_professional_icon(icon_type, size=24, color="#ffffff"):
                     colored_painter.setCompositionMode(
                         QPainter.CompositionMode_Multiply
                     )
-                    colored_painter.fillRect(colored_pixmap.rect(), color_obj)
+                    colored_painter.fillRect(target, color_obj)
                 else:
                     # For opaque colors, use the SourceAtop method
                     colored_painter.drawPixmap(0, 0, pixmap)
                     colored_painter.setCompositionMode(
                         QPainter.CompositionMode_SourceAtop
                     )
-                    colored_painter.fillRect(colored_pixmap.rect(), color_obj)
+                    colored_painter.fillRect(target, color_obj)
 
                 colored_painter.end()
                 return QIcon(colored_pixmap)
@@ -182,7 +201,7 @@ def create_professional_icon(icon_type, size=24, color="#ffffff"):
 def _create_coded_icon(icon_type, size=24, color="#ffffff"):
     """Create crisp, recognizable geometric icons using QPainter."""
     # Use higher DPI for crisp rendering
-    scale_factor = 2
+    scale_factor = _icon_scale_factor()
     actual_size = size * scale_factor
     pixmap = QPixmap(actual_size, actual_size)
     pixmap.setDevicePixelRatio(scale_factor)
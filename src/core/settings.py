@@ -0,0 +1,71 @@
+"""In-memory cache in front of QSettings for frequently toggled preferences."""
+
+from typing import Any, Dict, Optional, Set
+from PySide6.QtCore import QObject, QSettings, QTimer
+
+# Sentinels: key not looked up yet / key known to be absent from the store
+_MISSING = object()
+_UNSET = object()
+
+# Pending writes are handed to QSettings at most this often
+FLUSH_INTERVAL_MS = 5000
+
+
+class CachedSettings(QObject):
+    """Write-back cache around QSettings.
+
+    Reads hit the persistent store (registry/plist/ini) once per key and are
+    memoized. Writes only update the cache and mark the key dirty; dirty keys
+    are forwarded in one batch by a single-shot timer, or immediately on
+    ``flush()``/``sync()``. Exposes the subset of the QSettings API used by
+    the app, so it can be passed to the managers in place of a QSettings
+    instance.
+    """
+
+    def __init__(self, settings: QSettings, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._settings = settings
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def value(self, key: str, default: Any = None, type: Optional[type] = None):
+        """Return the value for key, reading the persistent store at most once."""
+        cached = self._cache.get(key, _MISSING)
+        if cached is _MISSING:
+            if not self._settings.contains(key):
+                self._cache[key] = _UNSET
+                return default
+            if type is not None:
+                cached = self._settings.value(key, default, type=type)
+            else:
+                cached = self._settings.value(key, default)
+            self._cache[key] = cached
+        elif cached is _UNSET:
+            return default
+        return cached
+
+    def setValue(self, key: str, value: Any):
+        """Store value for key and schedule a deferred write if it changed."""
+        if self._cache.get(key, _MISSING) == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Forward all pending writes to the underlying QSettings."""
+        self._flush_timer.stop()
+        for key in self._dirty:
+            self._settings.setValue(key, self._cache[key])
+        self._dirty.clear()
+
+    def sync(self):
+        """Flush pending changes to permanent storage."""
+        self.flush()
+        self._settings.sync()
@@ -1,12 +1,10 @@
 """Collection creation and editing dialog with comprehensive settings."""
 
+import os
 from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QRadioButton,
-    QSpinBox,
-    QButtonGroup,
     QGroupBox,
     QListWidget,
     QListWidgetItem,
@@ -19,6 +17,7 @@ from PySide6.QtCore import Qt
 from .styles import create_dialog_action_button, create_standard_button, confirm_dialog
 from .components.centered_dialog import CenteredDialog
 from .components.sorting_panel import SortingPanel
+from .components.timer_panel import TimerPanel
 
 
 class CollectionDialog(CenteredDialog):
@@ -26,6 +25,11 @@ class CollectionDialog(CenteredDialog):
 
     def __init__(self, parent=None, collection=None, existing_names=None):
         super().__init__(parent)
+        # One dialog per create/edit; free it once it is done instead of
+        # leaving a hidden child on the parent. Not WA_DeleteOnClose: that
+        # deletes the dialog inside exec(), before callers can read
+        # get_collection_data(). deleteLater() waits for the event loop.
+        self.finished.connect(self.deleteLater)
         self.collection = collection  # If provided, we're editing
         self.is_editing = collection is not None
 
@@ -40,6 +44,8 @@ class CollectionDialog(CenteredDialog):
         else:
             self.collection_name = ""
         self.folder_paths = collection.paths[:] if collection else []
+        # Normalized paths for O(1) duplicate checks in add_folder
+        self._folder_keys = {self._folder_key(p) for p in self.folder_paths}
         self.sort_method = collection.sort_method if collection else "random"
         self.sort_descending = collection.sort_descending if collection else False
         self.timer_enabled = False
@@ -48,6 +54,12 @@ class CollectionDialog(CenteredDialog):
         self.init_ui()
         self.populate_existing_data()
 
+    @staticmethod
+    def _folder_key(folder_path):
+        """Normalize a folder path so trailing slashes and case (on Windows)
+        don't hide duplicates."""
+        return os.path.normcase(os.path.normpath(folder_path))
+
     @staticmethod
     def _next_default_name(existing_names):
         existing = set(existing_names)
@@ -81,32 +93,15 @@ class CollectionDialog(CenteredDialog):
 
         # Folders section
         folders_label = QLabel("Folders:")
-        folders_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        folders_label.setObjectName("foldersLabel")
         left_layout.addWidget(folders_label)
 
         # Folders list
         self.folders_list = QListWidget()
         self.folders_list.setMinimumHeight(150)
         self.folders_list.setToolTip("List of folders in this collection")
-        # Apply consistent styling to match the collections list
-        self.folders_list.setStyleSheet("""
-            QListWidget {
-                outline: none;
-                show-decoration-selected: 1;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #35383b;
-                min-height: 20px;
-            }
-            QListWidget::item:hover {
-                background-color: #2e3034;
-            }
-            QListWidget::item:selected {
-                background-color: #354e6e;
-                color: white;
-            }
-        """)
+        # Shares the collections list rules in DARK_STYLESHEET
+        self.folders_list.setObjectName("foldersList")
         left_layout.addWidget(self.folders_list)
 
         # Folder buttons
@@ -147,52 +142,12 @@ class CollectionDialog(CenteredDialog):
             timer_info = QLabel(
                 "Set default timer settings for this collection.\nYou can change these when opening the collection."
             )
-            timer_info.setStyleSheet("color: #666; font-size: 11px;")
+            timer_info.setObjectName("timerHint")
             timer_info.setWordWrap(True)
             timer_layout.addWidget(timer_info)
 
-            # Radio buttons for timer options
-            self.button_group = QButtonGroup()
-
-            self.no_timer_radio = QRadioButton("No timer - manual navigation only")
-            self.no_timer_radio.setChecked(True)
-            self.button_group.addButton(self.no_timer_radio, 0)
-            timer_layout.addWidget(self.no_timer_radio)
-
-            # Preset timer options
-            presets = [
-                ("30 seconds", 30),
-                ("1 minute", 60),
-                ("2 minutes", 120),
-                ("5 minutes", 300),
-            ]
-
-            self.preset_radios = []
-            for i, (label, seconds) in enumerate(presets):
-                radio = QRadioButton(label)
-                self.button_group.addButton(radio, i + 1)
-                self.preset_radios.append((radio, seconds))
-                timer_layout.addWidget(radio)
-
-            # Custom timer option
-            custom_layout = QHBoxLayout()
-            self.custom_radio = QRadioButton("Custom:")
-            self.button_group.addButton(self.custom_radio, len(presets) + 1)
-            custom_layout.addWidget(self.custom_radio)
-
-            self.custom_spinbox = QSpinBox()
-            self.custom_spinbox.setRange(5, 3600)  # 5 seconds to 1 hour
-            self.custom_spinbox.setValue(60)
-            self.custom_spinbox.setSuffix(" seconds")
-            self.custom_spinbox.setEnabled(False)
-            self.custom_spinbox.setMinimumHeight(32)  # Match standard button height
-            custom_layout.addWidget(self.custom_spinbox)
-
-            custom_layout.addStretch()
-            timer_layout.addLayout(custom_layout)
-
-            # Connect signals
-            self.custom_radio.toggled.connect(self.custom_spinbox.setEnabled)
+            self.timer_panel = TimerPanel()
+            timer_layout.addWidget(self.timer_panel)
 
             right_layout.addWidget(timer_group)
 
@@ -256,17 +211,18 @@ class CollectionDialog(CenteredDialog):
         folder = QFileDialog.getExistingDirectory(self, "Select folder to add")
         if folder:
             # Check if folder already exists
-            for i in range(self.folders_list.count()):
-                if self.folders_list.item(i).text() == folder:
-                    QMessageBox.information(
-                        self,
-                        "Folder Already Added",
-                        "This folder is already part of the collection.",
-                    )
-                    return
+            key = self._folder_key(folder)
+            if key in self._folder_keys:
+                QMessageBox.information(
+                    self,
+                    "Folder Already Added",
+                    "This folder is already part of the collection.",
+                )
+                return
 
             self.add_folder_to_list(folder)
             self.folder_paths.append(folder)
+            self._folder_keys.add(key)
 
     def remove_folder(self):
         """Remove the selected folder from the collection."""
@@ -287,6 +243,7 @@ class CollectionDialog(CenteredDialog):
                 self.folders_list.takeItem(row)
                 if folder_path in self.folder_paths:
                     self.folder_paths.remove(folder_path)
+                self._folder_keys = {self._folder_key(p) for p in self.folder_paths}
 
     def on_folder_selection_changed(self):
         """Handle folder list selection changes."""
@@ -295,20 +252,7 @@ class CollectionDialog(CenteredDialog):
 
     def get_timer_settings(self):
         """Get the selected timer settings."""
-
-        checked_button = self.button_group.checkedButton()
-        button_id = self.button_group.id(checked_button)
-
-        if button_id == 0:  # No timer
-            return False, 60
-        elif button_id == len(self.preset_radios) + 1:  # Custom
-            return True, self.custom_spinbox.value()
-        else:  # Preset
-            for i, (radio, seconds) in enumerate(self.preset_radios):
-                if button_id == i + 1:
-                    return True, seconds
-
-        return False, 60  # Default fallback
+        return self.timer_panel.get_timer_settings()
 
     def get_sorting_settings(self):
         """Get the selected sorting settings."""
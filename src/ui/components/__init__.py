@@ -1,6 +1,14 @@
 """Reusable UI components for the Glimpse application."""
 
 from .centered_dialog import CenteredDialog, CenteredMainWindow
+from .collection_list_model import CollectionListModel
 from .sorting_panel import SortingPanel
+from .timer_panel import TimerPanel
 
-__all__ = ["CenteredDialog", "CenteredMainWindow", "SortingPanel"]
+__all__ = [
+    "CenteredDialog",
+    "CenteredMainWindow",
+    "CollectionListModel",
+    "SortingPanel",
+    "TimerPanel",
+]
@@ -1,7 +1,45 @@
 """Base class for dialogs that automatically center themselves on screen."""
 
 from PySide6.QtWidgets import QDialog, QApplication
-from PySide6.QtCore import QTimer
+
+# Primary screen's available geometry, cached until the display setup changes
+_screen_geometry = None
+_watched_screen = None
+
+
+def _invalidate_screen_geometry(*_args):
+    """Drop the cached geometry; the next lookup re-queries the screen."""
+    global _screen_geometry
+    _screen_geometry = None
+
+
+def available_screen_geometry():
+    """Return the primary screen's available geometry.
+
+    The value only changes when displays are reconfigured, so it is cached
+    and invalidated by the primary screen's signals instead of being
+    queried every time a window is centered.
+    """
+    global _screen_geometry, _watched_screen
+    if _screen_geometry is None:
+        app = QApplication.instance()
+        screen = app.primaryScreen()
+        if screen is not _watched_screen:
+            if _watched_screen is None:
+                app.primaryScreenChanged.connect(_invalidate_screen_geometry)
+            screen.availableGeometryChanged.connect(_invalidate_screen_geometry)
+            _watched_screen = screen
+        _screen_geometry = screen.availableGeometry()
+    return _screen_geometry
+
+
+def center_widget_on_screen(widget):
+    """Move widget so its frame is centered on the primary screen."""
+    screen = available_screen_geometry()
+    frame = widget.frameGeometry()
+    x = (screen.width() - frame.width()) // 2 + screen.x()
+    y = (screen.height() - frame.height()) // 2 + screen.y()
+    widget.move(x, y)
 
 
 class CenteredDialog(QDialog):
@@ -17,17 +55,14 @@ class CenteredDialog(QDialog):
 
     def center_on_screen(self):
         """Center the dialog on the screen."""
-        screen = QApplication.primaryScreen().availableGeometry()
-        dialog = self.frameGeometry()
-        x = (screen.width() - dialog.width()) // 2 + screen.x()
-        y = (screen.height() - dialog.height()) // 2 + screen.y()
-        self.move(x, y)
+        center_widget_on_screen(self)
 
     def showEvent(self, event):
         """Override showEvent to center dialog when shown."""
+        # Center before the first frame is painted so the dialog doesn't
+        # appear at its default position and then jump
+        self.center_on_screen()
         super().showEvent(event)
-        # Use QTimer.singleShot to center after dialog is fully rendered
-        QTimer.singleShot(0, self.center_on_screen)
 
 
 class CenteredMainWindow(QDialog):
@@ -43,20 +78,12 @@ class CenteredMainWindow(QDialog):
 
     def center_on_screen(self):
         """Center the window on the screen."""
-        screen = QApplication.primaryScreen().availableGeometry()
-        window = self.frameGeometry()
-        x = (screen.width() - window.width()) // 2 + screen.x()
-        y = (screen.height() - window.height()) // 2 + screen.y()
-        self.move(x, y)
+        center_widget_on_screen(self)
 
     def showEvent(self, event):
         """Override showEvent to center window when first shown."""
-        super().showEvent(event)
+        # Same as CenteredDialog: move before the first paint, not after
         if not self._centered:
-            # Use QTimer to center after window is fully shown
-            QTimer.singleShot(0, self._delayed_center)
+            self.center_on_screen()
             self._centered = True
-
-    def _delayed_center(self):
-        """Delayed centering to ensure window is fully rendered."""
-        self.center_on_screen()
+        super().showEvent(event)
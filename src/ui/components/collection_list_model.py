@@ -0,0 +1,125 @@
+"""List model exposing collections to Qt item views."""
+
+from typing import Dict, List, Optional
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from ...core.collections import Collection
+
+EMPTY_COLLECTIONS_TEXT = "No collections found. Create your first collection!"
+
+
+class CollectionListModel(QAbstractListModel):
+    """Read-only model over a list of Collection objects.
+
+    Replaces per-collection QListWidgetItems: the view only asks for the rows
+    it actually paints, and a refresh is applied as a diff against the
+    current rows so selection and scroll position survive it. When the list
+    is empty a single non-selectable placeholder row is shown.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Collection] = []
+        self._name_to_row: Dict[str, int] = {}
+
+    def set_collections(self, collections: List[Collection]):
+        """Replace the model contents with the given collections.
+
+        Rows are matched by collection name: vanished names are removed, new
+        ones inserted, and a change of order is reported as a layout change,
+        so views keep their current row instead of being reset. If no name
+        survives the model is reset instead.
+        """
+        collections = list(collections)
+        new_names = {c.name for c in collections}
+        if new_names.isdisjoint(self._name_to_row):
+            # Entering or leaving the placeholder state changes every row, and
+            # so does removing every old row: in between, rowCount() would
+            # fall back to the placeholder and disagree with the removals
+            self.beginResetModel()
+            self._set_rows(collections)
+            self.endResetModel()
+            return
+
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row].name not in new_names:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+        # Append additions for now; the layout change below moves them
+        kept = {c.name for c in self._rows}
+        added = [c for c in collections if c.name not in kept]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+
+        if [c.name for c in self._rows] != [c.name for c in collections]:
+            self.layoutAboutToBeChanged.emit()
+            old_rows = [c.name for c in self._rows]
+            self._set_rows(collections)
+            persistent = self.persistentIndexList()
+            self.changePersistentIndexList(
+                persistent,
+                [
+                    self.index(self._name_to_row[old_rows[index.row()]])
+                    for index in persistent
+                ],
+            )
+            self.layoutChanged.emit()
+        else:
+            self._set_rows(collections)
+
+        # Collections may have been re-read from disk; refresh visible text
+        self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1))
+
+    def _set_rows(self, collections: List[Collection]):
+        """Store rows and rebuild the name index."""
+        self._rows = collections
+        self._name_to_row = {c.name: row for row, c in enumerate(self._rows)}
+
+    def collection_at(self, row: int) -> Optional[Collection]:
+        """Return the collection at row, or None for the placeholder/out of range."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def row_for_name(self, name: str) -> Optional[int]:
+        """Return the row holding the collection called name, if present."""
+        return self._name_to_row.get(name)
+
+    @staticmethod
+    def _format_tooltip(collection: Collection) -> str:
+        """Build the tooltip text shown for a collection row."""
+        folder_count = len(collection.paths)
+        folders = f"{folder_count} folder{'s' if folder_count != 1 else ''}"
+        subtitle = f"{folders}, {collection.image_count} images"
+        return f"{collection.name}\n{subtitle}"
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        # Reserve one row for the empty-state placeholder
+        return len(self._rows) or 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if not self._rows:
+            return EMPTY_COLLECTIONS_TEXT if role == Qt.DisplayRole else None
+        if role == Qt.DisplayRole:
+            return self._rows[row].name
+        if role == Qt.ToolTipRole:
+            # Built on demand: the view only asks for rows being hovered
+            return self._format_tooltip(self._rows[row])
+        if role == Qt.UserRole:
+            return self._rows[row]
+        return None
+
+    def flags(self, index):
+        if not self._rows:
+            return Qt.NoItemFlags
+        return super().flags(index)
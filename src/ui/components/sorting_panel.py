@@ -3,6 +3,34 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 from PySide6.QtCore import Signal
 
+# Sort method keys in combo box order, and their display labels
+SORT_METHODS = ("random", "name", "path", "size", "date")
+SORT_DISPLAY = {
+    "random": "Random (shuffle)",
+    "name": "Name (alphabetical)",
+    "path": "Full path",
+    "size": "File size",
+    "date": "Date modified",
+}
+# Full "method (order)" labels for every known setting, built once
+SORT_LABELS = {
+    (method, descending): SORT_DISPLAY[method]
+    + (" (descending)" if descending and method != "random" else "")
+    for method in SORT_METHODS
+    for descending in (False, True)
+}
+
+
+def sort_label(sort_method, sort_descending):
+    """Return the display label for a sort setting, e.g. "File size (descending)"."""
+    label = SORT_LABELS.get((sort_method, bool(sort_descending)))
+    if label is None:
+        # Unknown method from a hand-edited collection file; show it as-is
+        label = sort_method
+        if sort_descending:
+            label += " (descending)"
+    return label
+
 
 class SortingPanel(QWidget):
     """Reusable sorting panel with method and order selection.
@@ -18,15 +46,9 @@ class SortingPanel(QWidget):
         super().__init__(parent)
         self.show_current_info = show_current_info
 
-        # Sort method mapping
-        self.sort_methods = ["random", "name", "path", "size", "date"]
-        self.sort_method_labels = [
-            "Random (shuffle)",
-            "Name (alphabetical)",
-            "Full path",
-            "File size",
-            "Date modified",
-        ]
+        # Sort method mapping (shared module constants)
+        self.sort_methods = SORT_METHODS
+        self.sort_method_labels = [SORT_DISPLAY[method] for method in SORT_METHODS]
 
         self.init_ui()
         if show_current_info and current_info_text:
@@ -40,9 +62,7 @@ class SortingPanel(QWidget):
         # Show current collection settings if requested
         if self.show_current_info:
             self.current_info_label = QLabel()
-            self.current_info_label.setStyleSheet(
-                "color: #666; font-size: 11px; margin-bottom: 5px;"
-            )
+            self.current_info_label.setObjectName("sortingInfo")
             layout.addWidget(self.current_info_label)
 
         # Sort method row
@@ -74,15 +94,8 @@ class SortingPanel(QWidget):
         self.sort_order_combo.addItems(["Ascending", "Descending"])
         self.sort_order_combo.setMinimumWidth(160)
 
-        # Set custom styling for disabled state
-        disabled_style = """
-            QComboBox:disabled {
-                background-color: #1e1e1e;
-                color: #666666;
-                border: 1px solid #333333;
-            }
-        """
-        self.sort_order_combo.setStyleSheet(disabled_style)
+        # Disabled look comes from QComboBox#sortOrderCombo in DARK_STYLESHEET
+        self.sort_order_combo.setObjectName("sortOrderCombo")
         sort_order_layout.addWidget(self.sort_order_combo)
 
         sort_order_layout.addStretch()
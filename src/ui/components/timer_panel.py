@@ -0,0 +1,78 @@
+"""Reusable auto-advance timer panel for collections and viewing settings."""
+
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QComboBox, QSpinBox
+
+
+class TimerPanel(QWidget):
+    """Reusable timer panel with no-timer, preset and custom interval options.
+
+    Eliminates duplicate timer UI code across collection_dialog.py and timer_dialog.py.
+    """
+
+    DEFAULT_INTERVAL = 60  # seconds
+
+    # Item data for the option combo: 0 = no timer, CUSTOM = use the spinbox
+    NO_TIMER = 0
+    CUSTOM = -1
+
+    # Timer options: (label, seconds or NO_TIMER/CUSTOM), shared by every panel
+    TIMER_OPTIONS = (
+        ("No timer - manual navigation only", NO_TIMER),
+        ("30 seconds", 30),
+        ("1 minute", 60),
+        ("2 minutes", 120),
+        ("5 minutes", 300),
+        ("Custom…", CUSTOM),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.init_ui()
+
+    def init_ui(self):
+        """Initialize the timer panel UI."""
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+
+        # One combo instead of a radio button per option
+        self.option_combo = QComboBox()
+        for label, seconds in self.TIMER_OPTIONS:
+            self.option_combo.addItem(label, seconds)
+        self.option_combo.setMinimumHeight(32)  # Match standard button height
+        layout.addWidget(self.option_combo)
+
+        # Custom interval, only shown for the "Custom…" option
+        self.custom_spinbox = QSpinBox()
+        self.custom_spinbox.setRange(5, 3600)  # 5 seconds to 1 hour
+        self.custom_spinbox.setValue(self.DEFAULT_INTERVAL)
+        self.custom_spinbox.setSuffix(" seconds")
+        self.custom_spinbox.setMinimumHeight(32)  # Match standard button height
+        self.custom_spinbox.setVisible(False)
+        layout.addWidget(self.custom_spinbox)
+
+        layout.addStretch()
+
+        # Connect signals
+        self.option_combo.currentIndexChanged.connect(self._on_option_changed)
+
+    def _on_option_changed(self):
+        """Show the custom interval spinbox only for the custom option."""
+        self.custom_spinbox.setVisible(self.option_combo.currentData() == self.CUSTOM)
+
+    # Public API methods
+    def get_timer_settings(self):
+        """Get the selected timer settings as a tuple (enabled, interval_seconds)."""
+        seconds = self.option_combo.currentData()
+
+        if seconds == self.CUSTOM:
+            return True, self.custom_spinbox.value()
+        if seconds:  # Preset
+            return True, seconds
+
+        return False, self.DEFAULT_INTERVAL  # No timer
+
+    def reset(self):
+        """Reset to no timer with the default custom interval."""
+        self.option_combo.setCurrentIndex(0)
+        self.custom_spinbox.setValue(self.DEFAULT_INTERVAL)
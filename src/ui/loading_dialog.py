@@ -1,13 +1,17 @@
 """Loading dialog with progress indication for large collections."""
 
-from PySide6.QtWidgets import QVBoxLayout, QLabel, QProgressBar
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QCoreApplication, QEvent
 from PySide6.QtGui import QFont
 import os
 from typing import List
 
-from ..core.image_utils import IMAGE_EXTENSIONS
+from ..core.image_utils import IMAGE_SUFFIXES
 from .components.centered_dialog import CenteredDialog
+from .styles import create_dialog_action_button
+
+# Number of paths batched into each images_found emission
+CHUNK_SIZE = 256
 
 
 class ImageLoadingWorker(QThread):
@@ -16,11 +20,15 @@ class ImageLoadingWorker(QThread):
     progress_updated = Signal(
         int, int, str
     )  # current_images, estimated_total, current_folder
-    loading_finished = Signal(list)  # List of image paths
+    images_found = Signal(list)  # Newly found paths, in batches of CHUNK_SIZE
+    loading_finished = Signal(list, int)  # List of image paths, total count
 
-    def __init__(self, paths: List[str]):
+    def __init__(self, paths: List[str], collect_paths: bool = True):
         super().__init__()
         self.paths = paths if isinstance(paths, list) else [paths]
+        # When False only the count is tracked: no path lists are built or
+        # emitted, which keeps large scans cheap for callers that just count
+        self.collect_paths = collect_paths
         self._should_stop = False
 
     def stop(self):
@@ -30,52 +38,98 @@ class ImageLoadingWorker(QThread):
     def run(self):
         """Load images from all provided paths."""
         all_images = []
+        pending = []
         found = 0
+        collect = self.collect_paths
         running_max = 100  # lookahead buffer; grows as we find more
 
-        for base_path in self.paths:
-            if self._should_stop:
-                return
-            if not os.path.exists(base_path):
-                continue
-
-            for root, dirs, files in os.walk(base_path):
+        try:
+            for base_path in self.paths:
                 if self._should_stop:
                     return
+                if not os.path.exists(base_path):
+                    continue
 
-                folder_name = os.path.basename(root) or os.path.basename(base_path)
-
-                for filename in files:
+                # Depth-first walk in os.walk order, but on os.scandir directly:
+                # one readdir pass per folder, file/dir type from the entry itself
+                pending_dirs = [base_path]
+                while pending_dirs:
                     if self._should_stop:
                         return
 
-                    if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
-                        all_images.append(os.path.join(root, filename))
-                        found += 1
-
-                        if found % 50 == 0:
-                            running_max = max(running_max, int(found * 1.1))
-                            self.progress_updated.emit(found, running_max, folder_name)
-
-                # emit after each folder so small collections still get updates
-                running_max = max(running_max, int(found * 1.1))
-                self.progress_updated.emit(found, running_max, folder_name)
+                    root = pending_dirs.pop()
+                    folder_name = os.path.basename(root) or os.path.basename(base_path)
+                    subdirs = []
+
+                    try:
+                        with os.scandir(root) as entries:
+                            for entry in entries:
+                                if self._should_stop:
+                                    return
+
+                                try:
+                                    is_dir = entry.is_dir()
+                                except OSError:
+                                    is_dir = False
+                                if is_dir:
+                                    # Like os.walk, don't follow directory symlinks
+                                    if not entry.is_symlink():
+                                        subdirs.append(entry.path)
+                                    continue
+
+                                if not entry.name.lower().endswith(IMAGE_SUFFIXES):
+                                    continue
+
+                                found += 1
+                                if collect:
+                                    all_images.append(entry.path)
+                                    pending.append(entry.path)
+
+                                    if len(pending) >= CHUNK_SIZE:
+                                        self.images_found.emit(pending)
+                                        pending = []
+
+                                if found % 50 == 0:
+                                    running_max = max(running_max, int(found * 1.1))
+                                    self.progress_updated.emit(
+                                        found, running_max, folder_name
+                                    )
+                    except OSError:
+                        continue
+
+                    pending_dirs.extend(reversed(subdirs))
+
+                    # emit after each folder so small collections still get updates
+                    running_max = max(running_max, int(found * 1.1))
+                    self.progress_updated.emit(found, running_max, folder_name)
+        finally:
+            # Also on stop: paths found so far still reach the consumer
+            if pending:
+                self.images_found.emit(pending)
 
         if not self._should_stop:
-            self.loading_finished.emit(all_images)
+            self.loading_finished.emit(all_images, found)
 
 
 class LoadingDialog(CenteredDialog):
-    """Loading dialog with progress bar and folder information."""
+    """Loading dialog with progress bar and folder information.
+
+    Can be used modally via exec(), or shown non-modally while consumers
+    pick up results incrementally through chunk_ready.
+    """
 
-    def __init__(self, paths: List[str], parent=None):
+    chunk_ready = Signal(list)  # Batch of newly found image paths
+
+    def __init__(self, paths: List[str], parent=None, count_only: bool = False):
         super().__init__(parent)
         self.paths = paths
+        self.count_only = count_only
         self.worker = None
         self.images = []
+        self.image_count = 0
 
         self.setWindowTitle("Loading Images...")
-        self.setFixedSize(400, 150)
+        self.setFixedSize(400, 190)
         self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint)
 
         self.init_ui()
@@ -99,7 +153,7 @@ class LoadingDialog(CenteredDialog):
         # Progress info
         self.info_label = QLabel("Initializing...")
         self.info_label.setAlignment(Qt.AlignCenter)
-        self.info_label.setStyleSheet("color: #888888;")
+        self.info_label.setObjectName("loadingInfo")
         layout.addWidget(self.info_label)
 
         # Progress bar
@@ -107,19 +161,7 @@ class LoadingDialog(CenteredDialog):
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #2b2b2b;
-                text-align: center;
-                color: white;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 2px;
-            }
-        """)
+        self.progress_bar.setObjectName("loadingProgress")
         layout.addWidget(self.progress_bar)
 
         # Image count
@@ -127,10 +169,19 @@ class LoadingDialog(CenteredDialog):
         self.count_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.count_label)
 
+        # Cancel stops the scan; images found so far stay with the consumer
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        cancel_button = create_dialog_action_button("Cancel", icon_name="cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
     def start_loading(self):
         """Start the image loading process."""
-        self.worker = ImageLoadingWorker(self.paths)
+        self.worker = ImageLoadingWorker(self.paths, collect_paths=not self.count_only)
         self.worker.progress_updated.connect(self.on_progress_updated)
+        self.worker.images_found.connect(self.chunk_ready)
         self.worker.loading_finished.connect(self.on_loading_finished)
         self.worker.start()
 
@@ -143,23 +194,39 @@ class LoadingDialog(CenteredDialog):
         self.info_label.setText(f"Scanning: {folder_name}")
         self.count_label.setText(f"Found: {current_images} images")
 
-    def on_loading_finished(self, images: List[str]):
+    def on_loading_finished(self, images: List[str], image_count: int):
         """Handle completion of image loading."""
         self.images = images
+        self.image_count = image_count
         self.progress_bar.setValue(self.progress_bar.maximum())
         self.info_label.setText("Loading complete!")
-        self.count_label.setText(f"Found: {len(images)} images")
+        self.count_label.setText(f"Found: {image_count} images")
 
         # Brief delay to show completion, then close
         QTimer.singleShot(500, self.accept)
 
-    def closeEvent(self, event):
-        """Handle dialog close event."""
+    def stop_worker(self):
+        """Stop the background scan if it is still running."""
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker.wait(3000)  # Wait up to 3 seconds
+
+    def reject(self):
+        """Cancel loading."""
+        self.stop_worker()
+        # Deliver the worker's last queued batch before finished is emitted
+        QCoreApplication.sendPostedEvents(self, QEvent.MetaCall)
+        super().reject()
+
+    def closeEvent(self, event):
+        """Handle dialog close event."""
+        self.stop_worker()
         event.accept()
 
     def get_images(self) -> List[str]:
-        """Get the loaded images."""
+        """Get the loaded images (empty when constructed with count_only)."""
         return self.images
+
+    def get_image_count(self) -> int:
+        """Get the number of images found by the completed scan."""
+        return self.image_count
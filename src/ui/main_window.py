@@ -13,16 +13,16 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QInputDialog,
     QDialog,
-    QApplication,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
     QDialogButtonBox,
     QLabel as QDialogLabel,
 )
-from PySide6.QtGui import QPixmap, QColor
-from PySide6.QtCore import Qt, QTimer, QSettings
+from PySide6.QtGui import QColor, QImageReader
+from PySide6.QtCore import Qt, QSettings
 
+from .components.centered_dialog import center_widget_on_screen
 from .widgets import ClickableLabel, MinimalProgressBar, ButtonOverlay
 from .startup_dialog import StartupDialog
 from .loading_dialog import LoadingDialog
@@ -31,10 +31,90 @@ from .managers.media_controls_manager import MediaControlsManager
 from .managers.history_manager import HistoryManager
 from .managers.menu_manager import MenuManager
 from ..core.collections import Collection
+from ..core.settings import CachedSettings
+
+
+def _make_folder_opener():
+    """Pick the platform's "open folder in file manager" call once."""
+    if os.name == "nt":
+        return os.startfile
+    if sys.platform == "darwin":
+        return lambda folder: subprocess.Popen(["open", folder])
+    return lambda folder: subprocess.Popen(["xdg-open", folder])
+
+
+_OPEN_FOLDER = _make_folder_opener()
+
+# Shortcut reference shown by KeyboardShortcutsDialog
+SHORTCUTS = (
+    ("←  →", "Navigate previous/next image"),
+    ("Space", "Play/pause timer"),
+    ("Ctrl +", "Zoom in"),
+    ("Ctrl -", "Zoom out"),
+    ("Ctrl 0", "Reset zoom and center image"),
+    ("F", "Flip image horizontally"),
+    ("G", "Toggle grayscale mode"),
+    ("B", "Cycle background modes"),
+    ("H", "Toggle history panel"),
+    ("Esc", "Switch collection/folder"),
+    ("Right-click", "Open context menu"),
+)
+
+# Applied once to the dialog; object names scope each rule to its widget
+_SHORTCUTS_DIALOG_STYLE = """
+    QLabel#shortcutsTitle {
+        font-size: 16px;
+        font-weight: bold;
+        color: #b7bcc1;
+        margin-bottom: 8px;
+    }
+    QTableWidget#shortcutsTable {
+        background-color: #232629;
+        color: #b7bcc1;
+        gridline-color: #35383b;
+        border: 1px solid #35383b;
+    }
+    QTableWidget#shortcutsTable::item {
+        padding: 8px;
+        border-bottom: 1px solid #35383b;
+    }
+    QTableWidget#shortcutsTable::item:selected {
+        background-color: #354e6e;
+    }
+    QTableWidget#shortcutsTable QHeaderView::section {
+        background-color: #35383b;
+        color: #b7bcc1;
+        padding: 8px;
+        border: 1px solid #232629;
+        font-weight: bold;
+    }
+    QDialogButtonBox#shortcutsButtons {
+        margin-top: 8px;
+    }
+    QDialogButtonBox#shortcutsButtons QPushButton {
+        background-color: #0078d4;
+        color: white;
+        font-size: 12px;
+        font-weight: 500;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QDialogButtonBox#shortcutsButtons QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QDialogButtonBox#shortcutsButtons QPushButton:pressed {
+        background-color: #005a9e;
+    }
+"""
 
 
 class KeyboardShortcutsDialog(QDialog):
-    """Dialog to display keyboard shortcuts help."""
+    """Dialog to display keyboard shortcuts help.
+
+    Built once by GlimpseViewer and reused for every subsequent open.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -42,7 +122,12 @@ class KeyboardShortcutsDialog(QDialog):
         self.setModal(True)
         self.resize(450, 400)
 
-        # Center the dialog
+        self.center_on_parent()
+        self.init_ui()
+
+    def center_on_parent(self):
+        """Center the dialog over its parent window."""
+        parent = self.parentWidget()
         if parent:
             parent_geometry = parent.frameGeometry()
             dialog_geometry = self.frameGeometry()
@@ -50,65 +135,26 @@ class KeyboardShortcutsDialog(QDialog):
             y = parent_geometry.center().y() - dialog_geometry.height() // 2
             self.move(x, y)
 
-        self.init_ui()
-
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
         layout.setContentsMargins(16, 16, 16, 16)
 
+        # One style pass for the whole dialog instead of one per child
+        self.setStyleSheet(_SHORTCUTS_DIALOG_STYLE)
+
         # Title
         title_label = QDialogLabel("Keyboard Shortcuts")
-        title_label.setStyleSheet(
-            "font-size: 16px; font-weight: bold; color: #b7bcc1; margin-bottom: 8px;"
-        )
+        title_label.setObjectName("shortcutsTitle")
         layout.addWidget(title_label)
 
         # Create table for shortcuts
-        table = QTableWidget(11, 2)
+        table = QTableWidget(len(SHORTCUTS), 2)
         table.setHorizontalHeaderLabels(["Shortcut", "Action"])
         table.verticalHeader().hide()
+        table.setObjectName("shortcutsTable")
 
-        # Set table style
-        table.setStyleSheet("""
-            QTableWidget {
-                background-color: #232629;
-                color: #b7bcc1;
-                gridline-color: #35383b;
-                border: 1px solid #35383b;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #35383b;
-            }
-            QTableWidget::item:selected {
-                background-color: #354e6e;
-            }
-            QHeaderView::section {
-                background-color: #35383b;
-                color: #b7bcc1;
-                padding: 8px;
-                border: 1px solid #232629;
-                font-weight: bold;
-            }
-        """)
-
-        # Add shortcuts data
-        shortcuts = [
-            ("←  →", "Navigate previous/next image"),
-            ("Space", "Play/pause timer"),
-            ("Ctrl +", "Zoom in"),
-            ("Ctrl -", "Zoom out"),
-            ("Ctrl 0", "Reset zoom and center image"),
-            ("F", "Flip image horizontally"),
-            ("G", "Toggle grayscale mode"),
-            ("B", "Cycle background modes"),
-            ("H", "Toggle history panel"),
-            ("Esc", "Switch collection/folder"),
-            ("Right-click", "Open context menu"),
-        ]
-
-        for row, (shortcut, action) in enumerate(shortcuts):
+        for row, (shortcut, action) in enumerate(SHORTCUTS):
             shortcut_item = QTableWidgetItem(shortcut)
             action_item = QTableWidgetItem(action)
 
@@ -129,27 +175,7 @@ class KeyboardShortcutsDialog(QDialog):
 
         # Close button
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
-        button_box.setStyleSheet("""
-            QDialogButtonBox {
-                margin-top: 8px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
+        button_box.setObjectName("shortcutsButtons")
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
 
@@ -164,7 +190,7 @@ class GlimpseViewer(QMainWindow):
         self.setGeometry(100, 100, 950, 650)
 
         # Initialize settings
-        self.settings = QSettings("glimpse", "Glimpse")
+        self.settings = CachedSettings(QSettings("glimpse", "Glimpse"), self)
 
         # Initialize state
         self.folder = None
@@ -250,6 +276,15 @@ class GlimpseViewer(QMainWindow):
         self.media_controls.progress_updated.connect(self._on_progress_updated)
 
         self._initial_image_shown = False
+        self._shortcuts_dialog = None  # Built on first use, then reused
+
+        # Background folder scan feeding self.images (see _start_streaming_load)
+        self._loading_dialog = None
+        self._awaiting_first_image = False
+
+        # Last values pushed to the progress bar
+        self._last_progress_total = -1
+        self._last_progress_px = -1
 
     # ImageDisplayManager signal handlers
     def _on_image_changed(self, img_path):
@@ -259,6 +294,21 @@ class GlimpseViewer(QMainWindow):
         self.current_image = img_path
         self.update_image_info(img_path)
         self._update_title(img_path)
+        self._preload_next_image()
+
+    def _preload_next_image(self):
+        """Decode the most likely next image in the background."""
+        collection = self.current_collection
+        if collection and collection.sort_method != "random":
+            next_path = self.history_manager.peek_next_image(
+                collection.sort_method,
+                "desc" if collection.sort_descending else "asc",
+            )
+        else:
+            next_path = self.history_manager.peek_next_image()
+
+        if next_path and next_path != self.current_image:
+            self.image_display.preload_images([next_path])
 
     def _on_zoom_changed(self, zoom_factor):
         """Handle zoom changed signal from ImageDisplayManager."""
@@ -288,11 +338,7 @@ class GlimpseViewer(QMainWindow):
 
     def center_on_screen(self):
         """Center the window on the screen."""
-        screen = QApplication.primaryScreen().availableGeometry()
-        window = self.frameGeometry()
-        x = (screen.width() - window.width()) // 2 + screen.x()
-        y = (screen.height() - window.height()) // 2 + screen.y()
-        self.move(x, y)
+        center_widget_on_screen(self)
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -316,10 +362,9 @@ class GlimpseViewer(QMainWindow):
         self.image_label.back.connect(self.show_previous_image)
         self.image_label.forward.connect(self.show_next_image)
         self.image_label.wheel_zoom.connect(self.handle_wheel_zoom)
-        self.image_label.pan_start.connect(self.start_panning)
         self.image_label.pan_move.connect(self.handle_panning)
-        self.image_label.pan_end.connect(self.end_panning)
         self.image_label.mouse_moved.connect(self.show_controls)
+        self.image_label.set_hover_tracking(True)
 
         # Set up context menu
         self.image_label.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -344,6 +389,12 @@ class GlimpseViewer(QMainWindow):
         # Button overlay at bottom middle - always visible when image is loaded
         self.button_overlay = ButtonOverlay(self.image_label)
         self.button_overlay.hide()
+        # The overlay has a fixed size; read it once instead of per resize
+        self._button_overlay_size = (
+            self.button_overlay.width(),
+            self.button_overlay.height(),
+        )
+        self._last_overlay_label_size = None
 
         # Connect button signals
         self.button_overlay.previous_clicked.connect(self.show_previous_image)
@@ -359,13 +410,14 @@ class GlimpseViewer(QMainWindow):
 
     def showEvent(self, event):
         """Handle show event to center window and display initial image."""
-        super().showEvent(event)
-
-        # Center window on first show
+        # Center on first show, before the first frame is painted, so the
+        # window doesn't appear at its default position and then jump
         if not hasattr(self, "_centered"):
-            QTimer.singleShot(0, self.center_on_screen)
+            self.center_on_screen()
             self._centered = True
 
+        super().showEvent(event)
+
         # Show initial image if available
         if not self._initial_image_shown and self.images:
             # For initial image load, preserve user settings (grayscale, etc.)
@@ -397,6 +449,10 @@ class GlimpseViewer(QMainWindow):
     # MediaControlsManager signal handlers
     def _on_timer_state_changed(self, active, paused):
         """Handle timer state changes from MediaControlsManager."""
+        # Force the next progress update through after a start/stop/reset
+        self._last_progress_total = -1
+        self._last_progress_px = -1
+
         # Update button overlay to reflect timer state
         if hasattr(self, "button_overlay"):
             self.button_overlay.set_pause_state(paused, active)
@@ -410,10 +466,20 @@ class GlimpseViewer(QMainWindow):
 
     def _on_progress_updated(self, remaining, total):
         """Handle progress updates from MediaControlsManager."""
-        # Update progress bar
-        if hasattr(self, "progress_bar"):
+        if not hasattr(self, "progress_bar"):
+            return
+
+        # Only push values that change what is drawn: the total is invariant
+        # for a run, and the bar moves only when its pixel width changes
+        if total != self._last_progress_total:
             self.progress_bar.set_total_time(total)
+            self._last_progress_total = total
+            self._last_progress_px = -1
+
+        px = remaining * self.progress_bar.width() // max(1, total)
+        if px != self._last_progress_px:
             self.progress_bar.set_remaining_time(remaining)
+            self._last_progress_px = px
 
     def toggle_pause(self):
         """Toggle pause state of the auto-advance timer."""
@@ -556,20 +622,21 @@ class GlimpseViewer(QMainWindow):
 
     def update_image_info(self, img_path=None):
         """Update image information display."""
-        if img_path is None or not os.path.exists(img_path):
+        meta = self.image_display.get_image_meta(img_path) if img_path else None
+        if meta is None:
             self._update_title()
             return
 
         # OPTIMIZATION: Use cached pixmap if available to avoid redundant loading
-        base = os.path.basename(img_path)
+        base = meta.name
         cached_pixmap = self.image_display._cached_pixmap
         if cached_pixmap and not cached_pixmap.isNull():
             info = f"{cached_pixmap.width()}x{cached_pixmap.height()}"
         else:
-            # Fallback to loading only if no cache available
-            pixmap = QPixmap(img_path)
-            if not pixmap.isNull():
-                info = f"{pixmap.width()}x{pixmap.height()}"
+            # Fallback: read dimensions from the file header, no pixel decode
+            size = QImageReader(img_path).size()
+            if size.isValid():
+                info = f"{size.width()}x{size.height()}"
             else:
                 info = base
 
@@ -581,8 +648,9 @@ class GlimpseViewer(QMainWindow):
 
     def _update_title_only(self, img_path=None):
         """Fast title update for rapid navigation without expensive operations."""
-        if img_path and os.path.exists(img_path):
-            base = os.path.basename(img_path)
+        meta = self.image_display.get_image_meta(img_path) if img_path else None
+        if meta:
+            base = meta.name
             if self.current_collection:
                 self._update_title_for_collection()
             else:
@@ -670,7 +738,9 @@ class GlimpseViewer(QMainWindow):
         super().resizeEvent(event)
 
     def closeEvent(self, event):
+        self._cancel_streaming_load()
         self.image_display.cleanup()
+        self.settings.sync()
         super().closeEvent(event)
 
     def toggle_history_panel(self, checked):
@@ -686,6 +756,9 @@ class GlimpseViewer(QMainWindow):
 
     def change_bg_mode(self, mode):
         """Change the background color mode."""
+        # Re-selecting the active mode changes nothing on screen
+        if self.settings.value("bg_mode", "Black") == mode:
+            return
         self.settings.setValue("bg_mode", mode)
         if self.current_image:
             self.image_display.display_image(self.current_image)
@@ -693,16 +766,8 @@ class GlimpseViewer(QMainWindow):
     def cycle_background_mode(self):
         """Cycle through background modes: Black -> Gray -> Adaptive Color -> Black."""
         current_mode = self.settings.value("bg_mode", "Black")
-        modes = ["Black", "Gray", "Adaptive Color"]
-
-        try:
-            current_index = modes.index(current_mode)
-            next_index = (current_index + 1) % len(modes)
-            next_mode = modes[next_index]
-        except ValueError:
-            # If current mode is not in list, default to first mode
-            next_mode = modes[0]
-
+        # Unknown modes fall back to the first mode
+        next_mode = MenuManager.BG_MODE_NEXT.get(current_mode, MenuManager.BG_MODES[0])
         self.change_bg_mode(next_mode)
 
     def _get_current_background_color(self):
@@ -732,11 +797,16 @@ class GlimpseViewer(QMainWindow):
 
     def show_keyboard_shortcuts(self):
         """Show the keyboard shortcuts help dialog."""
-        dialog = KeyboardShortcutsDialog(self)
-        dialog.exec()
+        if self._shortcuts_dialog is None:
+            self._shortcuts_dialog = KeyboardShortcutsDialog(self)
+        else:
+            self._shortcuts_dialog.center_on_parent()
+        self._shortcuts_dialog.exec()
 
     def toggle_grayscale(self, checked):
         """Toggle grayscale mode."""
+        if self.image_display.is_grayscale == checked:
+            return
         self.settings.setValue("grayscale_enabled", checked)
         self.image_display.is_grayscale = checked
         if self.current_image:
@@ -764,15 +834,20 @@ class GlimpseViewer(QMainWindow):
 
     def _update_overlay_positions(self):
         """Update positions of progress bar and button overlay."""
-        if self.image_label.width() > 0 and self.image_label.height() > 0:
-            # Position progress bar at bottom, full width
-            self.progress_bar.setGeometry(
-                0, self.image_label.height() - 4, self.image_label.width(), 4
-            )
-            # Position button overlay at bottom center
-            overlay_x = (self.image_label.width() - self.button_overlay.width()) // 2
-            overlay_y = self.image_label.height() - self.button_overlay.height() - 20
-            self.button_overlay.move(overlay_x, overlay_y)
+        label_w = self.image_label.width()
+        label_h = self.image_label.height()
+        if label_w <= 0 or label_h <= 0:
+            return
+        # Both overlays depend only on the label size; skip identical layouts
+        if (label_w, label_h) == self._last_overlay_label_size:
+            return
+        self._last_overlay_label_size = (label_w, label_h)
+
+        # Position progress bar at bottom, full width
+        self.progress_bar.setGeometry(0, label_h - 4, label_w, 4)
+        # Position button overlay at bottom center
+        overlay_w, overlay_h = self._button_overlay_size
+        self.button_overlay.move((label_w - overlay_w) // 2, label_h - overlay_h - 20)
 
     def _build_menu_state(self):
         history_info = self.history_manager.get_history_info()
@@ -811,14 +886,7 @@ class GlimpseViewer(QMainWindow):
         """Open the current image's folder in file explorer."""
         if not self.current_image:
             return
-        path = os.path.abspath(self.current_image)
-        folder = os.path.dirname(path)
-        if os.name == "nt":
-            os.startfile(folder)
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", folder])
-        else:
-            subprocess.Popen(["xdg-open", folder])
+        _OPEN_FOLDER(os.path.dirname(os.path.abspath(self.current_image)))
 
     def handle_wheel_zoom(self, angle):
         """Handle mouse wheel zoom."""
@@ -836,17 +904,9 @@ class GlimpseViewer(QMainWindow):
         """Reset zoom to 100%."""
         self.image_display.reset_zoom()
 
-    def start_panning(self, pos):
-        """Start panning operation."""
-        self.image_display.start_panning(pos)
-
-    def handle_panning(self, delta):
+    def handle_panning(self, dx, dy):
         """Handle panning movement with improved logic."""
-        self.image_display.handle_panning(delta)
-
-    def end_panning(self):
-        """End panning operation."""
-        self.image_display.end_panning()
+        self.image_display.handle_panning(dx, dy)
 
     def reset_pan(self):
         """Reset pan position to center."""
@@ -868,42 +928,23 @@ class GlimpseViewer(QMainWindow):
         self.folder = None  # Clear single folder
 
         # Configure timer settings via MediaControlsManager
-        self.media_controls.set_timer_interval(timer_interval)
-        if timer_enabled:
-            self.media_controls.start_timer()
-        else:
-            self.media_controls.stop_timer()
+        self.media_controls.configure(timer_enabled, timer_interval)
 
-        # For sorted collections (not random), we need to get sorted images
-        if collection.sort_method == "random":
-            # Show loading dialog for large collections and shuffle after loading
-            loading_dialog = LoadingDialog(collection.paths, self)
-            if loading_dialog.exec() == QDialog.Accepted:
-                self.images = loading_dialog.get_images()
-            else:
-                self.images = []  # User cancelled loading
+        # Random collections stream in from a background scan; sorted ones
+        # need the complete list before the first image can be picked
+        streaming = collection.sort_method == "random"
+        if streaming:
+            self.images = []
         else:
             # Get sorted images directly from collection
             self.images = collection.get_sorted_images()
 
-        # Clear history and set new images in history manager
-        self.history_manager.clear_history()
-        self.history_manager.set_images(self.images)
-
-        # Update MediaControlsManager about image availability
-        self.media_controls.set_has_images(len(self.images) > 0)
-
-        # Reset positional transforms but preserve user preferences (grayscale)
-        self.image_display.reset_positional_transforms_without_display()
-
-        # Reset first image flag to show controls for new collection
-        self._first_image_shown = False
-
-        # Update UI
-        self.update_image_info()
+        self._reset_view_state()
         self._update_title_for_collection()
 
-        if self.images:
+        if streaming:
+            self._start_streaming_load(collection.paths)
+        elif self.images:
             if self.isVisible():
                 self.show_random_image(preserve_transforms=True)
                 self._initial_image_shown = True
@@ -919,22 +960,21 @@ class GlimpseViewer(QMainWindow):
         self.current_collection = None  # Clear collection
 
         # Configure timer settings via MediaControlsManager
-        self.media_controls.set_timer_interval(timer_interval)
-        if timer_enabled:
-            self.media_controls.start_timer()
-        else:
-            self.media_controls.stop_timer()
+        self.media_controls.configure(timer_enabled, timer_interval)
 
         # Save as last folder for quick access
         self.settings.setValue("last_folder", folder_path)
 
-        # Show loading dialog for large folders
-        loading_dialog = LoadingDialog([folder_path], self)
-        if loading_dialog.exec() == QDialog.Accepted:
-            self.images = loading_dialog.get_images()
-        else:
-            self.images = []  # User cancelled loading
+        # Images stream in from a background scan (see _append_images)
+        self.images = []
+
+        self._reset_view_state()
+        self._update_title()
 
+        self._start_streaming_load([folder_path])
+
+    def _reset_view_state(self):
+        """Reset history and view state after self.images has been replaced."""
         # Clear history and set new images in history manager
         self.history_manager.clear_history()
         self.history_manager.set_images(self.images)
@@ -944,19 +984,58 @@ class GlimpseViewer(QMainWindow):
 
         # Reset positional transforms but preserve user preferences (grayscale)
         self.image_display.reset_positional_transforms_without_display()
+        self.image_display.clear_image_meta()
 
-        # Reset first image flag to show controls for new folder
+        # Reset first image flag to show controls for the new images
         self._first_image_shown = False
 
-        # Update UI
         self.update_image_info()
-        self._update_title()
 
+    def _start_streaming_load(self, paths):
+        """Scan paths in the background, showing images as soon as they are found."""
+        self._cancel_streaming_load()
+        self._awaiting_first_image = True
+
+        dialog = LoadingDialog(paths, self)
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.chunk_ready.connect(self._append_images)
+        dialog.finished.connect(self._on_streaming_load_finished)
+        self._loading_dialog = dialog
+        dialog.show()
+
+    def _cancel_streaming_load(self):
+        """Stop a scan still feeding the previous collection/folder."""
+        dialog = self._loading_dialog
+        if dialog is None:
+            return
+        self._loading_dialog = None
+        dialog.chunk_ready.disconnect(self._append_images)
+        dialog.finished.disconnect(self._on_streaming_load_finished)
+        dialog.reject()
+        dialog.deleteLater()
+
+    def _append_images(self, paths):
+        """Add a batch of scanned images and show the first one right away."""
+        self.images.extend(paths)
+        self.history_manager.add_images(paths)
+        self.media_controls.set_has_images(True)
+
+        if self._awaiting_first_image and self.isVisible():
+            self._awaiting_first_image = False
+            self.show_random_image(preserve_transforms=True)
+            self._initial_image_shown = True
+
+    def _on_streaming_load_finished(self, result):
+        """Handle the end of a background scan, whether complete or cancelled."""
+        if self._loading_dialog is not None:
+            self._loading_dialog.deleteLater()
+        self._loading_dialog = None
+        self._awaiting_first_image = False
         if self.images:
-            if self.isVisible():
-                self.show_random_image(preserve_transforms=True)
-                self._initial_image_shown = True
-            # else: showEvent will handle it when the window becomes visible
+            return
+
+        if self.current_collection:
+            self.image_label.setText("No images found in selected collection.")
         else:
             self.image_label.setText(
                 "No images found in selected folder or its subfolders."
@@ -2,11 +2,27 @@
 
 import os
 import random
+import re
 from PySide6.QtWidgets import QListWidgetItem
 from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt, QObject, Signal
 
 
+def _natural_sort_key(path):
+    """Generate a key for natural/human sorting of filenames."""
+    name = os.path.basename(path).lower()
+    # Split the filename into text and number parts
+    parts = re.split(r"(\d+)", name)
+    # Convert numeric parts to integers for proper sorting
+    result = []
+    for part in parts:
+        if part.isdigit():
+            result.append(int(part))
+        else:
+            result.append(part)
+    return result
+
+
 class HistoryManager(QObject):
     """Manages image history, navigation, and thumbnail panel functionality."""
 
@@ -27,12 +43,32 @@ class HistoryManager(QObject):
         self.images = []
         self.current_image = None
 
+        # Shuffled play order, consumed front to back by get_random_image
+        self._random_queue = []
+        self._queue_pos = 0
+        self._sorted_cache = None  # ((sort_method, sort_order), sorted list)
+
         self.history_list = history_list_widget
         self.history_list.itemClicked.connect(self.on_history_clicked)
 
     def set_images(self, images):
         """Set the current image collection."""
         self.images = images[:]
+        self._random_queue = images[:]
+        random.shuffle(self._random_queue)
+        self._queue_pos = 0
+        self._sorted_cache = None
+
+    def add_images(self, images):
+        """Append newly found images, e.g. while a folder scan streams in."""
+        self.images.extend(images)
+        queue = self._random_queue
+        for img in images:
+            # Swap into a random unplayed slot so new finds are mixed in
+            queue.append(img)
+            j = random.randint(self._queue_pos, len(queue) - 1)
+            queue[-1], queue[j] = queue[j], queue[-1]
+        self._sorted_cache = None
 
     def clear_history(self):
         """Clear all history data."""
@@ -41,7 +77,7 @@ class HistoryManager(QObject):
         self.sorted_collection_index = 0
         if self.history_list:
             self.history_list.clear()
-            self.history_list.repaint()
+            self.history_list.update()
         self.current_image = None
 
     def add_to_history(self, img_path):
@@ -49,11 +85,12 @@ class HistoryManager(QObject):
         # If we're not at the end of history (i.e., we went back and now showing new image),
         # remove all forward history.
         if self.history_index < len(self.history) - 1:
-            self.history = self.history[: self.history_index + 1]
+            keep = self.history_index + 1
+            del self.history[keep:]
+            # Drop only the trailing rows; kept rows retain their thumbnails
             if self.history_list:
-                self.history_list.clear()
-                for path in self.history:
-                    self._add_history_item(path)
+                while self.history_list.count() > keep:
+                    self.history_list.takeItem(self.history_list.count() - 1)
 
         # Only add if not duplicating last
         if not self.history or self.history[-1] != img_path:
@@ -145,52 +182,42 @@ class HistoryManager(QObject):
             return True
 
     def get_random_image(self):
-        """Get a random image from the collection, avoiding recent history."""
+        """Get a random image from the collection, avoiding recent history.
+
+        Images come from a shuffled queue so each one is shown once per
+        pass; when the queue runs out, history is cleared and it reshuffles.
+        """
         if not self.images:
             return None
 
-        # Get available images (not in recent history)
-        available = [img for img in self.images if img not in self.history]
-        if not available:
-            # If all images are in history, clear it and start fresh
+        if self._queue_pos >= len(self._random_queue):
+            # Every image has been shown - clear history and start fresh
             self.clear_history()
-            available = self.images[:]
+            random.shuffle(self._random_queue)
+            self._queue_pos = 0
 
-        if available:
-            selected_image = random.choice(available)
-            self.add_to_history(selected_image)
-            self.image_requested.emit(selected_image)
-            return selected_image
+        selected_image = self._random_queue[self._queue_pos]
+        self._queue_pos += 1
 
-        return None
+        self.add_to_history(selected_image)
+        self.image_requested.emit(selected_image)
+        return selected_image
 
-    def get_sequential_image(self, sort_method="name", sort_order="asc"):
-        """Get the next image in sequential order based on sorting."""
-        if not self.images:
-            return None
+    def _sorted_images(self, sort_method, sort_order):
+        """Return the collection sorted for sequential viewing."""
+        key = (sort_method, sort_order)
+        if (
+            sort_method != "random"
+            and self._sorted_cache
+            and self._sorted_cache[0] == key
+        ):
+            return self._sorted_cache[1]
 
         # Create sorted list
         sorted_images = self.images[:]
 
         if sort_method == "name":
-
-            def natural_sort_key(path):
-                """Generate a key for natural/human sorting of filenames."""
-                import re
-
-                name = os.path.basename(path).lower()
-                # Split the filename into text and number parts
-                parts = re.split(r"(\d+)", name)
-                # Convert numeric parts to integers for proper sorting
-                result = []
-                for part in parts:
-                    if part.isdigit():
-                        result.append(int(part))
-                    else:
-                        result.append(part)
-                return result
-
-            sorted_images.sort(key=natural_sort_key, reverse=(sort_order == "desc"))
+            sorted_images.sort(key=_natural_sort_key, reverse=(sort_order == "desc"))
         elif sort_method == "date_modified":
             sorted_images.sort(
                 key=lambda x: os.path.getmtime(x), reverse=(sort_order == "desc")
@@ -201,6 +228,17 @@ class HistoryManager(QObject):
             )
         elif sort_method == "random":
             random.shuffle(sorted_images)
+            return sorted_images
+
+        self._sorted_cache = (key, sorted_images)
+        return sorted_images
+
+    def get_sequential_image(self, sort_method="name", sort_order="asc"):
+        """Get the next image in sequential order based on sorting."""
+        if not self.images:
+            return None
+
+        sorted_images = self._sorted_images(sort_method, sort_order)
 
         # Get next image in sequence
         if self.sorted_collection_index >= len(sorted_images):
@@ -213,6 +251,29 @@ class HistoryManager(QObject):
         self.image_requested.emit(selected_image)
         return selected_image
 
+    def peek_next_image(self, sort_method=None, sort_order="asc"):
+        """Return the image most likely to be shown next, without showing it.
+
+        Forward history wins; otherwise the next sorted image, or the head
+        of the shuffled queue that get_random_image() will consume.
+        """
+        if not self.images:
+            return None
+
+        if self.has_next():
+            return self.history[self.history_index + 1]
+
+        if sort_method and sort_method != "random":
+            sorted_images = self._sorted_images(sort_method, sort_order)
+            index = self.sorted_collection_index
+            if index >= len(sorted_images):
+                index = 0
+            return sorted_images[index]
+
+        if self._queue_pos < len(self._random_queue):
+            return self._random_queue[self._queue_pos]
+        return None
+
     def toggle_history_panel(self, visible, settings=None):
         """Toggle the history panel visibility."""
         if self.history_list:
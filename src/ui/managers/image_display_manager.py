@@ -2,16 +2,52 @@
 
 import os
 import time
+from typing import NamedTuple
 from PIL import Image
 from turbojpeg import TurboJPEG
-from PySide6.QtGui import QPixmap, QImage, QTransform, QPainter, QColor
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+from PySide6.QtGui import (
+    QPixmap,
+    QPixmapCache,
+    QImage,
+    QTransform,
+    QPainter,
+    QColor,
+)
+from PySide6.QtCore import Qt, QObject, Signal, QThread, QTimer
 
 from ...core.image_utils import set_adaptive_bg
+from .menu_manager import MenuManager
 
 # Performance benchmarking flag
 BENCHMARK = False
 
+# Background stylesheets for the fixed background modes
+_GRAY_BG_STYLE = "background-color: #444444;"
+_BLACK_BG_STYLE = "background-color: #000000;"
+
+# Budget for processed (transformed) pixmaps kept in QPixmapCache, in KB
+PROCESSED_CACHE_LIMIT_KB = 256 * 1024
+
+# Optional multi-threaded grayscale kernel for very large images
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rgb32_to_gray(arr, out):
+        # arr is (h, w, 4) in memory order B, G, R, A (little-endian RGB32)
+        for i in prange(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                out[i, j] = (
+                    arr[i, j, 2] * 77 + arr[i, j, 1] * 150 + arr[i, j, 0] * 29
+                ) >> 8
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many pixels Qt's single-threaded conversion is already fast enough
+NUMBA_GRAYSCALE_MIN_PIXELS = 4_000_000
+
 # Initialize TurboJPEG for blazing fast JPEG loading
 try:
     jpeg = TurboJPEG()
@@ -20,10 +56,22 @@ except Exception:
     TURBOJPEG_AVAILABLE = False
 
 
+class ImageMeta(NamedTuple):
+    """File details for an image path, gathered with a single os.stat()."""
+
+    name: str
+    mtime: float
+    size: int
+
+
 class ImagePreloader(QThread):
-    """Background thread for pre-loading images."""
+    """Background thread for pre-loading images.
 
-    image_loaded = Signal(str, QPixmap)  # path, pixmap
+    Decodes into QImage, which is safe to create off the GUI thread; the
+    QPixmap conversion happens in the receiving slot on the main thread.
+    """
+
+    image_loaded = Signal(str, QImage)  # path, image
 
     def __init__(self):
         super().__init__()
@@ -46,26 +94,23 @@ class ImagePreloader(QThread):
                 path = self.paths_to_load.pop(0)
                 try:
                     if os.path.exists(path):
-                        # Use Pillow for faster image loading
+                        # Use Pillow for faster image loading. Decode at full
+                        # size: preloaded pixmaps are displayed as the final
+                        # image, so a draft-sized one would blur when zoomed
                         pil_image = Image.open(path)
 
-                        # Use draft mode for JPEG - loads reduced size for speed
-                        if pil_image.format == "JPEG":
-                            # Load at ~1920x1080 max for speed (most screens)
-                            pil_image.draft("RGB", (1920, 1080))
-
-                        # Convert PIL image to QPixmap
-                        pixmap = self._pil_to_qpixmap(pil_image)
+                        # Convert PIL image to QImage
+                        image = self._pil_to_qimage(pil_image)
 
-                        if not pixmap.isNull():
-                            self.image_loaded.emit(path, pixmap)
+                        if not image.isNull():
+                            self.image_loaded.emit(path, image)
                 except Exception:
                     pass  # Silently skip problematic images
             else:
                 self.msleep(10)  # Shorter sleep for more responsiveness
 
-    def _pil_to_qpixmap(self, pil_image):
-        """Convert PIL Image to QPixmap efficiently."""
+    def _pil_to_qimage(self, pil_image):
+        """Convert PIL Image to a QImage that owns its pixel data."""
         # Convert to RGB if needed
         if pil_image.mode != "RGB":
             pil_image = pil_image.convert("RGB")
@@ -79,7 +124,8 @@ class ImagePreloader(QThread):
             pil_image.width * 3,
             QImage.Format_RGB888,
         )
-        return QPixmap.fromImage(qimage)
+        # Detach from the Python buffer before handing it to another thread
+        return qimage.copy()
 
     def stop(self):
         """Stop the preloader thread and wait for it to finish."""
@@ -107,6 +153,14 @@ class ImageDisplayManager(QObject):
         # Pre-loading cache for fast navigation
         self._pixmap_cache = {}  # path -> pixmap
         self._max_cache_size = 10  # Keep last 10 images in memory
+        # Paths whose cached pixmap came from a reduced-size fast-mode decode
+        self._reduced_paths = set()
+
+        # Per-path stat results; cleared when a new collection/folder loads
+        self._meta = {}
+
+        # Processed pixmaps (after grayscale) - Qt evicts least recently used
+        QPixmapCache.setCacheLimit(PROCESSED_CACHE_LIMIT_KB)
 
         # Background preloader
         self.preloader = ImagePreloader()
@@ -118,6 +172,10 @@ class ImageDisplayManager(QObject):
         self.pan_offset_x = 0
         self.pan_offset_y = 0
 
+        # Set when a redraw is queued so bursts of wheel/pan events share one
+        self._zoom_dirty = False
+        self._target_size_cache = None  # (key, QSize) from _target_size
+
         # Transform state - initialize from settings
         self.is_flipped_h = False
         self.is_flipped_v = False
@@ -132,35 +190,78 @@ class ImageDisplayManager(QObject):
         """Stop background threads; call from the main window's closeEvent."""
         self.preloader.stop()
 
-    def _on_image_preloaded(self, path, pixmap):
+    def _on_image_preloaded(self, path, image):
         """Handle preloaded image from background thread."""
-        # Add to cache
+        if path in self._pixmap_cache and path not in self._reduced_paths:
+            return
+
+        # Preloads are decoded at full size
+        self._cache_pixmap(path, QPixmap.fromImage(image), full_size=True)
+
+    def _cache_pixmap(self, path, pixmap, full_size):
+        """Keep a decoded pixmap for fast revisits, noting if it is reduced."""
+        self._pixmap_cache.pop(path, None)
         self._pixmap_cache[path] = pixmap
+        if full_size:
+            self._reduced_paths.discard(path)
+        else:
+            self._reduced_paths.add(path)
 
         # Limit cache size (LRU-style)
         if len(self._pixmap_cache) > self._max_cache_size:
             # Remove oldest (first) item
             first_key = next(iter(self._pixmap_cache))
             del self._pixmap_cache[first_key]
+            self._reduced_paths.discard(first_key)
 
     def preload_images(self, paths):
         """Request preloading of images in background."""
         for path in paths[:5]:  # Preload next 5 images
-            if path not in self._pixmap_cache and os.path.exists(path):
+            cached = path in self._pixmap_cache and path not in self._reduced_paths
+            if not cached and os.path.exists(path):
                 self.preloader.add_path(path)
 
+    def get_image_meta(self, img_path, refresh=False):
+        """Return ImageMeta for a path, or None if it cannot be read.
+
+        Cached results are fine for titles; pass refresh=True to re-stat, so
+        edits (new mtime) and deletions made during the session are seen.
+        """
+        meta = None if refresh else self._meta.get(img_path)
+        if meta is None:
+            try:
+                st = os.stat(img_path)
+            except (OSError, TypeError, ValueError):
+                self._meta.pop(img_path, None)
+                return None
+            meta = ImageMeta(os.path.basename(img_path), st.st_mtime, st.st_size)
+            self._meta[img_path] = meta
+        return meta
+
+    def clear_image_meta(self):
+        """Forget cached file details, e.g. when switching collections."""
+        self._meta.clear()
+
     def display_image(self, img_path, fast_mode=False):
         """Display an image with current zoom, pan, and transform settings."""
         if BENCHMARK:
             start_total = time.perf_counter()
 
-        if not img_path or not os.path.exists(img_path):
+        # Fresh stat: catches deleted files and gives _processed_cache_key
+        # the current mtime
+        previous = self._meta.get(img_path)
+        meta = self.get_image_meta(img_path, refresh=True) if img_path else None
+        if meta is None:
             self.image_label.clear()
             self.image_label.setText("Image not found")
             return False
+        if previous is not None and previous.mtime != meta.mtime:
+            # Edited since it was decoded; don't reuse the old pixmap
+            self._pixmap_cache.pop(img_path, None)
+            self._reduced_paths.discard(img_path)
 
         # Check if image is too large for Qt
-        if self._is_image_too_large(img_path):
+        if self._is_image_too_large(meta.size):
             self.image_label.clear()
             self.image_label.setText("Image too large to display")
             return False
@@ -175,10 +276,10 @@ class ImageDisplayManager(QObject):
         if mode == "Adaptive Color" and not fast_mode:
             set_adaptive_bg(self.image_label, img_path)
         elif mode == "Gray":
-            self.image_label.parentWidget().setStyleSheet("background-color: #444444;")
+            self._set_background_style(_GRAY_BG_STYLE)
         elif mode == "Black" or (mode == "Adaptive Color" and fast_mode):
             # Use black background in fast mode even for adaptive (avoid expensive sampling)
-            self.image_label.parentWidget().setStyleSheet("background-color: #000000;")
+            self._set_background_style(_BLACK_BG_STYLE)
 
         if BENCHMARK:
             print(f"  BG: {(time.perf_counter() - start_bg) * 1000:.1f}ms")
@@ -196,14 +297,16 @@ class ImageDisplayManager(QObject):
 
         return success
 
-    def _is_image_too_large(self, img_path):
+    def _set_background_style(self, style):
+        """Apply a background stylesheet, skipping the re-polish if unchanged."""
+        parent = self.image_label.parentWidget()
+        if parent.styleSheet() != style:
+            parent.setStyleSheet(style)
+
+    def _is_image_too_large(self, file_size):
         """Check if an image file is likely too large for Qt to handle."""
-        try:
-            file_size = os.path.getsize(img_path)
-            # Skip files larger than 500MB - likely to cause Qt issues
-            return file_size > 500 * 1024 * 1024
-        except OSError:
-            return False
+        # Skip files larger than 500MB - likely to cause Qt issues
+        return file_size > 500 * 1024 * 1024
 
     def _load_and_process_image(self, img_path, fast_mode=False):
         """Load image and apply current transforms and zoom."""
@@ -211,8 +314,24 @@ class ImageDisplayManager(QObject):
             if BENCHMARK:
                 start_load = time.perf_counter()
 
-            # Check cache first for instant loading
-            cache_hit = img_path in self._pixmap_cache
+            # Revisiting an image with the same transforms is a hash lookup
+            processed_key = self._processed_cache_key(img_path)
+            if processed_key:
+                processed = QPixmapCache.find(processed_key)
+                if processed is not None and not processed.isNull():
+                    self._cached_pixmap = processed
+                    self._update_zoom_display(use_fast_transform=fast_mode)
+                    if BENCHMARK:
+                        print(
+                            f"  PROCESSED CACHE HIT: {(time.perf_counter() - start_load) * 1000:.1f}ms"
+                        )
+                    return True
+
+            # Check cache first for instant loading; a reduced fast-mode
+            # decode only stands in while still in fast mode
+            cache_hit = img_path in self._pixmap_cache and (
+                fast_mode or img_path not in self._reduced_paths
+            )
             if cache_hit:
                 pixmap = self._pixmap_cache[img_path]
                 if BENCHMARK:
@@ -229,18 +348,22 @@ class ImageDisplayManager(QObject):
 
                 if not pixmap.isNull():
                     # Add to cache for future use
-                    self._pixmap_cache[img_path] = pixmap
-                    # Limit cache size
-                    if len(self._pixmap_cache) > self._max_cache_size:
-                        first_key = next(iter(self._pixmap_cache))
-                        del self._pixmap_cache[first_key]
+                    self._cache_pixmap(img_path, pixmap, full_size=not fast_mode)
 
             if pixmap.isNull():
                 self.image_label.clear()
                 self.image_label.setText("Failed to load image")
                 return False
 
-            return self._process_image_immediately(pixmap, img_path, fast_mode)
+            success = self._process_image_immediately(pixmap, img_path, fast_mode)
+
+            # Only keep full-quality results: fast mode, or a source pixmap
+            # left in the cache by an earlier fast-mode decode, is reduced
+            full_size = img_path not in self._reduced_paths
+            if success and processed_key and not fast_mode and full_size:
+                QPixmapCache.insert(processed_key, self._cached_pixmap)
+
+            return success
 
         except Exception as e:
             print(f"Error loading image: {e}")
@@ -248,6 +371,15 @@ class ImageDisplayManager(QObject):
             self.image_label.setText("Error loading image")
             return False
 
+    def _processed_cache_key(self, img_path):
+        """Build the QPixmapCache key for an image and the current transforms."""
+        meta = self.get_image_meta(img_path)
+        if meta is None:
+            return None
+        mtime = meta.mtime
+        # Flips are applied at draw time, so they are not part of the key
+        return f"proc:{img_path}:{mtime}:{self.is_grayscale}"
+
     def _load_with_pillow(self, img_path, fast_mode=False):
         """Load image using fastest available method: TurboJPEG > Pillow > Qt."""
         try:
@@ -345,10 +477,9 @@ class ImageDisplayManager(QObject):
             # Only copy if we need to modify the pixmap
             self._cached_pixmap = pixmap
 
-            # Fast mode: Skip transforms if none are active (for rapid navigation)
-            if fast_mode and not (
-                self.is_flipped_h or self.is_flipped_v or self.is_grayscale
-            ):
+            # Fast mode: Skip processing if none is needed (for rapid navigation).
+            # Flips are not baked in here - they are applied when drawing.
+            if fast_mode and not self.is_grayscale:
                 # Direct display for speed with fast transformation
                 self._update_zoom_display(use_fast_transform=True)
                 if BENCHMARK:
@@ -357,38 +488,18 @@ class ImageDisplayManager(QObject):
                     )
                 return True
 
-            # Apply transforms to cached pixmap
+            # Apply grayscale to cached pixmap
             if BENCHMARK:
                 start_transform = time.perf_counter()
 
-            transform = QTransform()
-
-            if self.is_flipped_h:
-                transform = transform.scale(-1, 1)
-            if self.is_flipped_v:
-                transform = transform.scale(1, -1)
-
-            if self.is_flipped_h or self.is_flipped_v:
-                # Use fast transform in fast_mode
-                transform_mode = (
-                    Qt.FastTransformation if fast_mode else Qt.SmoothTransformation
-                )
-                self._cached_pixmap = self._cached_pixmap.transformed(
-                    transform, transform_mode
-                )
-
-            # Apply grayscale if enabled
             if self.is_grayscale:
-                image = self._cached_pixmap.toImage()
-                image = self._apply_improved_grayscale(image)
+                image = self._apply_improved_grayscale(self._cached_pixmap.toImage())
                 self._cached_pixmap = QPixmap.fromImage(image)
 
-            if BENCHMARK and (
-                self.is_flipped_h or self.is_flipped_v or self.is_grayscale
-            ):
-                print(
-                    f"  TRANSFORM: {(time.perf_counter() - start_transform) * 1000:.1f}ms"
-                )
+                if BENCHMARK:
+                    print(
+                        f"  TRANSFORM: {(time.perf_counter() - start_transform) * 1000:.1f}ms"
+                    )
 
             # Update display with zoom - use fast transform in fast mode
             self._update_zoom_display(use_fast_transform=fast_mode)
@@ -407,37 +518,56 @@ class ImageDisplayManager(QObject):
             return False
 
     def _apply_improved_grayscale(self, image):
-        """Apply improved grayscale conversion."""
+        """Apply improved grayscale conversion.
+
+        Grayscale8 is painted directly by Qt, so no expansion back to RGB32.
+        """
+        if image.format() == QImage.Format_Grayscale8:
+            return image
+        if (
+            NUMBA_AVAILABLE
+            and image.width() * image.height() >= NUMBA_GRAYSCALE_MIN_PIXELS
+            and image.format()
+            in (
+                QImage.Format_RGB32,
+                QImage.Format_ARGB32,
+                QImage.Format_ARGB32_Premultiplied,
+            )
+        ):
+            return self._grayscale_with_numba(image)
         return image.convertToFormat(QImage.Format_Grayscale8)
 
+    def _grayscale_with_numba(self, image):
+        """Convert a large 32-bit image to Grayscale8 across all cores."""
+        import numpy as np
+
+        width, height = image.width(), image.height()
+        bytes_per_line = image.bytesPerLine()
+        arr = np.frombuffer(
+            image.constBits(), np.uint8, count=bytes_per_line * height
+        ).reshape(height, bytes_per_line)[:, : width * 4]
+        arr = arr.reshape(height, width, 4)
+
+        out = np.empty((height, width), dtype=np.uint8)
+        _rgb32_to_gray(arr, out)
+
+        gray = QImage(out.data, width, height, width, QImage.Format_Grayscale8)
+        # Keep reference to prevent garbage collection
+        gray._array_ref = out
+        return gray
+
     def _update_zoom_display(self, use_fast_transform=False):
         """Update the image display with current zoom and pan settings."""
         if BENCHMARK:
             start_zoom = time.perf_counter()
 
+        # Any queued redraw is satisfied by this one
+        self._zoom_dirty = False
+
         if not self._cached_pixmap:
             return
 
-        # Get container size (label size)
-        container_size = self.image_label.size()
-        original_size = self._cached_pixmap.size()
-
-        # Calculate target size based on zoom
-        if self.zoom_factor == 1.0:
-            # For zoom level 1.0, fit image to container
-            target_size = original_size.scaled(container_size, Qt.KeepAspectRatio)
-        else:
-            # Calculate zoom from the fit-to-container size
-            if (
-                original_size.width() <= container_size.width()
-                and original_size.height() <= container_size.height()
-            ):
-                # Scale from original size for small images
-                target_size = original_size * self.zoom_factor
-            else:
-                # Scale from fit-to-container size for large images
-                fit_size = original_size.scaled(container_size, Qt.KeepAspectRatio)
-                target_size = fit_size * self.zoom_factor
+        target_size = self._target_size()
 
         if BENCHMARK:
             start_scale = time.perf_counter()
@@ -475,8 +605,18 @@ class ImageDisplayManager(QObject):
             x = (self.image_label.width() - scaled.width()) // 2 + self.pan_offset_x
             y = (self.image_label.height() - scaled.height()) // 2 + self.pan_offset_y
 
-            # Draw the scaled image at offset position
-            painter.drawPixmap(x, y, scaled)
+            # Draw the scaled image at offset position, mirrored in place
+            if self.is_flipped_h or self.is_flipped_v:
+                painter.translate(
+                    x + scaled.width() if self.is_flipped_h else x,
+                    y + scaled.height() if self.is_flipped_v else y,
+                )
+                painter.scale(
+                    -1 if self.is_flipped_h else 1, -1 if self.is_flipped_v else 1
+                )
+                painter.drawPixmap(0, 0, scaled)
+            else:
+                painter.drawPixmap(x, y, scaled)
             painter.end()
 
             self.image_label.setPixmap(canvas)
@@ -487,6 +627,14 @@ class ImageDisplayManager(QObject):
             if BENCHMARK:
                 start_set = time.perf_counter()
 
+            # Mirror the display-sized copy rather than the full-size source
+            if self.is_flipped_h or self.is_flipped_v:
+                scaled = scaled.transformed(
+                    QTransform.fromScale(
+                        -1 if self.is_flipped_h else 1, -1 if self.is_flipped_v else 1
+                    )
+                )
+
             self.image_label.setPixmap(scaled)
             # Force immediate update in fast mode - don't wait for event loop
             if use_fast_transform:
@@ -498,6 +646,56 @@ class ImageDisplayManager(QObject):
         if BENCHMARK:
             print(f"  ZOOM_DISPLAY: {(time.perf_counter() - start_zoom) * 1000:.1f}ms")
 
+    def _target_size(self):
+        """Return the displayed image size for the current zoom.
+
+        Pure QSize arithmetic, memoized per (pixmap, zoom, label size) so
+        the mouse-move events of a drag reuse the same result.
+        """
+        container_size = self.image_label.size()
+        key = (
+            self._cached_pixmap.cacheKey(),
+            self.zoom_factor,
+            container_size.width(),
+            container_size.height(),
+        )
+        if self._target_size_cache and self._target_size_cache[0] == key:
+            return self._target_size_cache[1]
+
+        original_size = self._cached_pixmap.size()
+
+        # Calculate target size based on zoom
+        if self.zoom_factor == 1.0:
+            # For zoom level 1.0, fit image to container
+            target_size = original_size.scaled(container_size, Qt.KeepAspectRatio)
+        else:
+            # Calculate zoom from the fit-to-container size
+            if (
+                original_size.width() <= container_size.width()
+                and original_size.height() <= container_size.height()
+            ):
+                # Scale from original size for small images
+                target_size = original_size * self.zoom_factor
+            else:
+                # Scale from fit-to-container size for large images
+                fit_size = original_size.scaled(container_size, Qt.KeepAspectRatio)
+                target_size = fit_size * self.zoom_factor
+
+        self._target_size_cache = (key, target_size)
+        return target_size
+
+    def _schedule_zoom_display(self):
+        """Queue a single redraw for the next event loop pass."""
+        if self._zoom_dirty:
+            return
+        self._zoom_dirty = True
+        QTimer.singleShot(0, self._flush_zoom_display)
+
+    def _flush_zoom_display(self):
+        """Run a queued redraw unless a synchronous one already happened."""
+        if self._zoom_dirty:
+            self._update_zoom_display()
+
     def _get_current_background_color(self):
         """Get the current background color as QColor based on the active mode."""
         mode = self.settings.value("bg_mode", "Black")
@@ -519,26 +717,33 @@ class ImageDisplayManager(QObject):
             return QColor(0, 0, 0)
 
     # Zoom Methods
+    def _step_zoom(self, zoom_in):
+        """Move the zoom factor one step; return True if it changed."""
+        if zoom_in and self.zoom_factor < self.MAX_ZOOM:
+            self.zoom_factor = min(self.zoom_factor + self.ZOOM_STEP, self.MAX_ZOOM)
+            return True
+        if not zoom_in and self.zoom_factor > self.MIN_ZOOM:
+            self.zoom_factor = max(self.zoom_factor - self.ZOOM_STEP, self.MIN_ZOOM)
+            return True
+        return False
+
     def zoom_in(self):
         """Zoom in on the image."""
-        if self.zoom_factor < self.MAX_ZOOM:
-            self.zoom_factor = min(self.zoom_factor + self.ZOOM_STEP, self.MAX_ZOOM)
+        if self._step_zoom(True):
             self._update_zoom_display()
             self.zoom_changed.emit(self.zoom_factor)
 
     def zoom_out(self):
         """Zoom out on the image."""
-        if self.zoom_factor > self.MIN_ZOOM:
-            self.zoom_factor = max(self.zoom_factor - self.ZOOM_STEP, self.MIN_ZOOM)
+        if self._step_zoom(False):
             self._update_zoom_display()
             self.zoom_changed.emit(self.zoom_factor)
 
     def handle_wheel_zoom(self, angle):
-        """Handle mouse wheel zoom."""
-        if angle > 0:
-            self.zoom_in()
-        else:
-            self.zoom_out()
+        """Handle mouse wheel zoom; fast spins are rescaled once per event loop pass."""
+        if self._step_zoom(angle > 0):
+            self._schedule_zoom_display()
+            self.zoom_changed.emit(self.zoom_factor)
 
     def reset_zoom(self):
         """Reset zoom to fit-to-container and center image."""
@@ -548,12 +753,8 @@ class ImageDisplayManager(QObject):
         self.zoom_changed.emit(self.zoom_factor)
 
     # Pan Methods
-    def start_panning(self, pos):
-        """Start panning operation."""
-        pass  # Just for signal connection, actual panning handled in handle_panning
-
-    def handle_panning(self, delta):
-        """Handle panning movement with improved logic."""
+    def handle_panning(self, dx, dy):
+        """Handle panning movement by (dx, dy) pixels with improved logic."""
         if not self._cached_pixmap:
             return
 
@@ -561,23 +762,13 @@ class ImageDisplayManager(QObject):
         container_size = self.image_label.size()
 
         # Always allow panning if there's currently a pan offset (to reset position)
-        new_offset_x = self.pan_offset_x + delta.x()
-        new_offset_y = self.pan_offset_y + delta.y()
+        new_offset_x = self.pan_offset_x + dx
+        new_offset_y = self.pan_offset_y + dy
+        old_offset = (self.pan_offset_x, self.pan_offset_y)
 
         if self.zoom_factor > 1.0:
-            # Apply panning with constraints
-            # Get current displayed image size
-            original_size = self._cached_pixmap.size()
-            if (
-                original_size.width() <= container_size.width()
-                and original_size.height() <= container_size.height()
-            ):
-                # Constrain panning so image doesn't go too far off screen
-                target_size = original_size * self.zoom_factor
-            else:
-                fit_size = original_size.scaled(container_size, Qt.KeepAspectRatio)
-                # Constrain panning so image doesn't go too far off screen
-                target_size = fit_size * self.zoom_factor
+            # Constrain panning so image doesn't go too far off screen
+            target_size = self._target_size()
 
             max_offset_x = max(
                 0, (target_size.width() - container_size.width()) // 2 + 50
@@ -594,11 +785,9 @@ class ImageDisplayManager(QObject):
             self.pan_offset_x = max(-max_movement, min(max_movement, new_offset_x))
             self.pan_offset_y = max(-max_movement, min(max_movement, new_offset_y))
 
-        self._update_zoom_display()
-
-    def end_panning(self):
-        """End panning operation."""
-        pass  # Panning state is maintained until next pan or reset
+        # Dragging further against a clamp doesn't move the image
+        if (self.pan_offset_x, self.pan_offset_y) != old_offset:
+            self._schedule_zoom_display()
 
     def reset_pan(self):
         """Reset pan offset to center."""
@@ -608,18 +797,20 @@ class ImageDisplayManager(QObject):
             self._update_zoom_display()
 
     # Transform Methods
+    # Flips only redraw from the cached pixmap, and queue that redraw so a
+    # quick horizontal + vertical sequence is drawn once.
     def flip_horizontal(self):
         """Toggle horizontal flip of the image."""
         self.is_flipped_h = not self.is_flipped_h
         if self.current_image:
-            self.display_image(self.current_image)
+            self._schedule_zoom_display()
         self.transform_changed.emit()
 
     def flip_vertical(self):
         """Toggle vertical flip of the image."""
         self.is_flipped_v = not self.is_flipped_v
         if self.current_image:
-            self.display_image(self.current_image)
+            self._schedule_zoom_display()
         self.transform_changed.emit()
 
     def toggle_grayscale(self):
@@ -633,20 +824,14 @@ class ImageDisplayManager(QObject):
     def cycle_background_mode(self):
         """Cycle through background modes: Black -> Gray -> Adaptive Color -> Black."""
         current_mode = self.settings.value("bg_mode", "Black")
-        modes = ["Black", "Gray", "Adaptive Color"]
-
-        try:
-            current_index = modes.index(current_mode)
-            next_index = (current_index + 1) % len(modes)
-            next_mode = modes[next_index]
-        except ValueError:
-            # If current mode is not in list, default to first mode
-            next_mode = modes[0]
-
+        # Unknown modes fall back to the first mode
+        next_mode = MenuManager.BG_MODE_NEXT.get(current_mode, MenuManager.BG_MODES[0])
         self.change_bg_mode(next_mode)
 
     def change_bg_mode(self, mode):
         """Change the background color mode."""
+        if self.settings.value("bg_mode", "Black") == mode:
+            return
         self.settings.setValue("bg_mode", mode)
         if self.current_image:
             self.display_image(self.current_image)
@@ -57,13 +57,26 @@ class MediaControlsManager(QObject):
             self.start_timer()
             return
 
-        self._timer_paused = not self._timer_paused
         if self._timer_paused:
-            self.timer.stop()
+            self.resume_timer()
         else:
-            if self._has_images:
-                self.timer.start()
+            self.pause_timer()
 
+    def pause_timer(self):
+        """Pause the countdown; the QTimer is stopped so nothing ticks while paused."""
+        if not self._auto_advance_active or self._timer_paused:
+            return
+        self._timer_paused = True
+        self.timer.stop()
+        self.timer_state_changed.emit(self._auto_advance_active, self._timer_paused)
+
+    def resume_timer(self):
+        """Resume a paused countdown from where it stopped."""
+        if not self._auto_advance_active or not self._timer_paused:
+            return
+        self._timer_paused = False
+        if self._has_images:
+            self.timer.start()
         self.timer_state_changed.emit(self._auto_advance_active, self._timer_paused)
 
     def reset_timer(self):
@@ -82,12 +95,29 @@ class MediaControlsManager(QObject):
         if self._auto_advance_active:
             self._reset_timer()
 
+    def configure(self, enabled, interval):
+        """Apply the timer settings chosen when opening a collection or folder.
+
+        Sets the interval and enabled state together so the countdown is
+        reset once, not once per setting.
+        """
+        self.timer_interval = max(1, interval)  # Ensure minimum 1 second
+        self.settings.setValue("timer_interval", self.timer_interval)
+        if enabled:
+            self.start_timer()
+        else:
+            self.stop_timer()
+
     def set_has_images(self, has_images):
         """Update whether there are images available for auto-advance."""
+        had_images = self._has_images
         self._has_images = has_images
         if not has_images and self._auto_advance_active:
             self.timer.stop()
             self.progress_updated.emit(0, self.timer_interval)
+        elif has_images and not had_images and self._auto_advance_active:
+            # First images arrived (e.g. a streaming load) - start counting down
+            self._reset_timer()
 
     # Public API - State Getters
     def is_active(self):
@@ -131,10 +161,13 @@ class MediaControlsManager(QObject):
             self.progress_updated.emit(0, self.timer_interval)
 
     def _on_timer_tick(self):
-        """Handle timer tick for auto-advance."""
-        if not self._auto_advance_active or not self._has_images or self._timer_paused:
+        """Handle timer tick for auto-advance.
+
+        Pausing stops the QTimer, so ticks only arrive while counting down.
+        """
+        if not self._auto_advance_active or not self._has_images:
+            self.timer.stop()
             if not self._auto_advance_active:
-                self.timer.stop()
                 self.progress_updated.emit(0, self.timer_interval)
             return
 
@@ -142,10 +175,13 @@ class MediaControlsManager(QObject):
         self.timer_tick.emit()
 
         if self.timer_remaining <= 0:
-            # Timer expired - emit signal for main window to handle
-            self.timer_expired.emit()
-            # Reset for next cycle
+            # Reset for the next cycle before dispatching, so the progress bar
+            # restarts while the next image is still being loaded. The
+            # connected slot runs synchronously on this (GUI) thread.
             self.timer_remaining = self.timer_interval
+            self._update_progress()
+            self.timer_expired.emit()
+            return
 
         self._update_progress()
 
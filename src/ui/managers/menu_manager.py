@@ -1,5 +1,6 @@
 """Menu and keyboard shortcut manager for the Random Image Viewer."""
 
+from types import MappingProxyType
 from PySide6.QtWidgets import QMenu, QInputDialog
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt, QObject, Signal, QTimer
@@ -42,6 +43,24 @@ class MenuManager(QObject):
     # Navigation completion signals
     navigation_completed = Signal()
 
+    # Menu presets, allocated once rather than per menu build
+    TIMER_INTERVAL_PRESETS = (
+        ("30s", 30),
+        ("1m", 60),
+        ("2m", 120),
+        ("5m", 300),
+        ("10m", 600),
+    )
+    BG_MODES = ("Black", "Gray", "Adaptive Color")
+    # Read-only view: shared by every instance, so it must not be mutated
+    BG_MODE_NEXT = MappingProxyType(
+        {
+            "Black": "Gray",
+            "Gray": "Adaptive Color",
+            "Adaptive Color": "Black",
+        }
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = None
@@ -54,6 +73,10 @@ class MenuManager(QObject):
         self.navigation_delay = 1  # ms - minimal delay for maximum speed
         self.is_navigating = False  # Prevent navigation queue buildup
 
+        # Context menu is built on first use and reused afterwards
+        self._context_menu = None
+        self._menu_state = {}
+
     def set_settings(self, settings):
         """Set the settings object for accessing configuration."""
         self.settings = settings
@@ -158,22 +181,17 @@ class MenuManager(QObject):
         if not self.settings:
             return
 
-        modes = ["Black", "Gray", "Adaptive Color"]
         current_mode = self.settings.value("bg_mode", "Black")
-
-        try:
-            current_index = modes.index(current_mode)
-            next_index = (current_index + 1) % len(modes)
-            next_mode = modes[next_index]
-        except ValueError:
-            # If current mode is not in list, default to first mode
-            next_mode = modes[0]
-
+        # Unknown modes fall back to the first mode
+        next_mode = self.BG_MODE_NEXT.get(current_mode, self.BG_MODES[0])
         self.background_mode_changed.emit(next_mode)
 
     def show_context_menu(self, global_pos, parent_widget, state):
         """Show the right-click context menu.
 
+        The menu is built once on first use; later calls only refresh the
+        state-dependent actions before showing it.
+
         Args:
             global_pos: QPoint in global screen coordinates.
             parent_widget: QWidget to parent menus/actions against.
@@ -183,74 +201,97 @@ class MenuManager(QObject):
         if not self.settings:
             return
 
+        if self._context_menu is None:
+            self._build_context_menu(parent_widget)
+
         history_index = state.get("history_index", 0)
         auto_advance_active = state.get("auto_advance_active", False)
         timer_paused = state.get("timer_paused", False)
         timer_interval = state.get("timer_interval", 60)
         zoom_factor = state.get("zoom_factor", 1.0)
         current_image = state.get("current_image", None)
+        self._menu_state = state
 
+        # --- Navigation ---
+        self._act_prev.setEnabled(history_index > 0)
+
+        # --- Timer Controls ---
+        if auto_advance_active:
+            self._act_timer_playpause.setText(
+                "Play Timer" if timer_paused else "Pause Timer"
+            )
+        else:
+            self._act_timer_playpause.setText("Start Timer")
+        self._act_stop_timer.setEnabled(auto_advance_active)
+        for value, act in self._timer_interval_actions.items():
+            act.setChecked(timer_interval == value)
+
+        # --- View Controls ---
+        self._act_reset_pan.setEnabled(zoom_factor > 1.0)
+        current_bg = self.settings.value("bg_mode", "Black")
+        for mode, act in self._bg_actions.items():
+            act.setChecked(current_bg == mode)
+        self._act_history.setChecked(
+            self.settings.value("show_history_panel", False, type=bool)
+        )
+
+        # --- Image Transform ---
+        self._act_grayscale.setChecked(
+            self.settings.value("grayscale_enabled", False, type=bool)
+        )
+
+        # --- File Actions ---
+        self._act_open_explorer.setEnabled(current_image is not None)
+
+        self._context_menu.exec(global_pos)
+
+    def _build_context_menu(self, parent_widget):
+        """Create the context menu and keep references to its dynamic actions."""
         menu = QMenu(parent_widget)
 
         # --- Navigation ---
-        prev_action = QAction("Previous", parent_widget)
-        prev_action.triggered.connect(lambda: self.previous_image_requested.emit())
-        prev_action.setEnabled(history_index > 0)
-        menu.addAction(prev_action)
+        self._act_prev = QAction("Previous", parent_widget)
+        self._act_prev.triggered.connect(self.previous_image_requested)
+        menu.addAction(self._act_prev)
 
         next_action = QAction("Next", parent_widget)
-        next_action.triggered.connect(lambda: self.next_or_random_requested.emit())
+        next_action.triggered.connect(self.next_or_random_requested)
         menu.addAction(next_action)
         menu.addSeparator()
 
         random_action = QAction("Random", parent_widget)
-        random_action.triggered.connect(lambda: self.random_image_requested.emit())
+        random_action.triggered.connect(self.random_image_requested)
         menu.addAction(random_action)
         menu.addSeparator()
 
         # --- Timer Controls ---
-        if auto_advance_active:
-            if timer_paused:
-                play_action = QAction("Play Timer", parent_widget)
-                play_action.triggered.connect(lambda: self.timer_pause_requested.emit())
-                menu.addAction(play_action)
-            else:
-                pause_action = QAction("Pause Timer", parent_widget)
-                pause_action.triggered.connect(
-                    lambda: self.timer_pause_requested.emit()
-                )
-                menu.addAction(pause_action)
-        else:
-            start_action = QAction("Start Timer", parent_widget)
-            start_action.triggered.connect(lambda: self.timer_start_requested.emit())
-            menu.addAction(start_action)
+        # One action doubles as Start/Pause/Play; its text is set on each show
+        self._act_timer_playpause = QAction("Start Timer", parent_widget)
+        self._act_timer_playpause.triggered.connect(self._on_timer_playpause)
+        menu.addAction(self._act_timer_playpause)
 
-        stop_action = QAction("Stop Timer", parent_widget)
-        stop_action.triggered.connect(lambda: self.timer_stop_requested.emit())
-        stop_action.setEnabled(auto_advance_active)
-        menu.addAction(stop_action)
+        self._act_stop_timer = QAction("Stop Timer", parent_widget)
+        self._act_stop_timer.triggered.connect(self.timer_stop_requested)
+        menu.addAction(self._act_stop_timer)
 
         # Timer interval submenu
         timer_menu = QMenu("Timer Interval", parent_widget)
-        for label, value in [
-            ("30s", 30),
-            ("1m", 60),
-            ("2m", 120),
-            ("5m", 300),
-            ("10m", 600),
-        ]:
+        self._timer_interval_actions = {}
+        for label, value in self.TIMER_INTERVAL_PRESETS:
             act = QAction(label, parent_widget)
             act.setCheckable(True)
-            act.setChecked(timer_interval == value)
             act.triggered.connect(
                 lambda checked, v=value: self.timer_interval_changed.emit(v)
             )
             timer_menu.addAction(act)
+            self._timer_interval_actions[value] = act
 
         timer_menu.addSeparator()
         custom_act = QAction("Custom...", parent_widget)
         custom_act.triggered.connect(
-            lambda: self._show_custom_timer_dialog(parent_widget, timer_interval)
+            lambda: self._show_custom_timer_dialog(
+                parent_widget, self._menu_state.get("timer_interval", 60)
+            )
         )
         timer_menu.addAction(custom_act)
         menu.addMenu(timer_menu)
@@ -261,95 +302,85 @@ class MenuManager(QObject):
 
         zoom_in_action = QAction("Zoom In", parent_widget)
         zoom_in_action.setShortcut("Ctrl++")
-        zoom_in_action.triggered.connect(lambda: self.zoom_in_requested.emit())
+        zoom_in_action.triggered.connect(self.zoom_in_requested)
         zoom_menu.addAction(zoom_in_action)
 
         zoom_out_action = QAction("Zoom Out", parent_widget)
         zoom_out_action.setShortcut("Ctrl+-")
-        zoom_out_action.triggered.connect(lambda: self.zoom_out_requested.emit())
+        zoom_out_action.triggered.connect(self.zoom_out_requested)
         zoom_menu.addAction(zoom_out_action)
 
         reset_zoom_action = QAction("Reset Zoom", parent_widget)
         reset_zoom_action.setShortcut("Ctrl+0")
-        reset_zoom_action.triggered.connect(lambda: self.reset_zoom_requested.emit())
+        reset_zoom_action.triggered.connect(self.reset_zoom_requested)
         zoom_menu.addAction(reset_zoom_action)
 
-        reset_pan_action = QAction("Reset Pan Position", parent_widget)
-        reset_pan_action.triggered.connect(lambda: self.reset_pan_requested.emit())
-        reset_pan_action.setEnabled(zoom_factor > 1.0)
-        zoom_menu.addAction(reset_pan_action)
+        self._act_reset_pan = QAction("Reset Pan Position", parent_widget)
+        self._act_reset_pan.triggered.connect(self.reset_pan_requested)
+        zoom_menu.addAction(self._act_reset_pan)
         menu.addMenu(zoom_menu)
 
         # Background color submenu
         bg_menu = QMenu("Background Color", parent_widget)
-        current_bg = self.settings.value("bg_mode", "Black")
-        for mode in ["Black", "Gray", "Adaptive Color"]:
+        self._bg_actions = {}
+        for mode in self.BG_MODES:
             act = QAction(mode, parent_widget)
             act.setCheckable(True)
-            act.setChecked(current_bg == mode)
             act.triggered.connect(
                 lambda checked, m=mode: self.background_mode_changed.emit(m)
             )
             bg_menu.addAction(act)
+            self._bg_actions[mode] = act
         menu.addMenu(bg_menu)
 
-        history_action = QAction("Show History Panel", parent_widget)
-        history_action.setCheckable(True)
-        history_action.setChecked(
-            self.settings.value("show_history_panel", False, type=bool)
-        )
-        history_action.toggled.connect(
-            lambda checked: self.history_panel_toggled.emit(checked)
-        )
-        menu.addAction(history_action)
+        # triggered (not toggled) so refreshing the check state emits nothing
+        self._act_history = QAction("Show History Panel", parent_widget)
+        self._act_history.setCheckable(True)
+        self._act_history.triggered.connect(self.history_panel_toggled)
+        menu.addAction(self._act_history)
         menu.addSeparator()
 
         # --- Image Transform ---
         transform_menu = QMenu("Transform", parent_widget)
 
-        grayscale_action = QAction("Grayscale", parent_widget)
-        grayscale_action.setCheckable(True)
-        grayscale_action.setChecked(
-            self.settings.value("grayscale_enabled", False, type=bool)
-        )
-        grayscale_action.toggled.connect(
-            lambda checked: self.grayscale_toggled.emit(checked)
-        )
-        transform_menu.addAction(grayscale_action)
+        self._act_grayscale = QAction("Grayscale", parent_widget)
+        self._act_grayscale.setCheckable(True)
+        self._act_grayscale.triggered.connect(self.grayscale_toggled)
+        transform_menu.addAction(self._act_grayscale)
 
         flip_h_action = QAction("Flip Horizontal", parent_widget)
-        flip_h_action.triggered.connect(lambda: self.flip_horizontal_requested.emit())
+        flip_h_action.triggered.connect(self.flip_horizontal_requested)
         transform_menu.addAction(flip_h_action)
 
         flip_v_action = QAction("Flip Vertical", parent_widget)
-        flip_v_action.triggered.connect(lambda: self.flip_vertical_requested.emit())
+        flip_v_action.triggered.connect(self.flip_vertical_requested)
         transform_menu.addAction(flip_v_action)
         menu.addMenu(transform_menu)
         menu.addSeparator()
 
         # --- File Actions ---
-        open_explorer_action = QAction("Open in File Explorer", parent_widget)
-        open_explorer_action.triggered.connect(
-            lambda: self.open_in_explorer_requested.emit()
-        )
-        open_explorer_action.setEnabled(current_image is not None)
-        menu.addAction(open_explorer_action)
+        self._act_open_explorer = QAction("Open in File Explorer", parent_widget)
+        self._act_open_explorer.triggered.connect(self.open_in_explorer_requested)
+        menu.addAction(self._act_open_explorer)
 
         welcome_action = QAction("Switch Collection/Folder...", parent_widget)
-        welcome_action.triggered.connect(
-            lambda: self.switch_collection_requested.emit()
-        )
+        welcome_action.triggered.connect(self.switch_collection_requested)
         menu.addAction(welcome_action)
 
         menu.addSeparator()
 
         shortcuts_action = QAction("Keyboard Shortcuts...", parent_widget)
-        shortcuts_action.triggered.connect(
-            lambda: self.keyboard_shortcuts_requested.emit()
-        )
+        shortcuts_action.triggered.connect(self.keyboard_shortcuts_requested)
         menu.addAction(shortcuts_action)
 
-        menu.exec(global_pos)
+        self._context_menu = menu
+
+    def _on_timer_playpause(self):
+        """Start the timer, or toggle pause if it is already running."""
+        if self._menu_state.get("auto_advance_active", False):
+            self.timer_pause_requested.emit()
+        else:
+            self.timer_start_requested.emit()
 
     def _show_custom_timer_dialog(self, parent_widget, current_interval):
         value, ok = QInputDialog.getInt(
@@ -2,27 +2,32 @@
 
 import os
 import sys
+import shutil
 import subprocess
+from datetime import datetime
+from functools import cache, lru_cache
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QFileDialog,
     QMessageBox,
     QWidget,
     QSplitter,
     QTextEdit,
+    QStackedWidget,
     QGroupBox,
     QSizePolicy,
 )
 from PySide6.QtGui import QFont, QDesktopServices
-from PySide6.QtCore import Qt, Signal, QUrl
+from PySide6.QtCore import Qt, Signal, QUrl, QTimer
 
 from ..core.collections import CollectionManager, Collection
 from .components.centered_dialog import CenteredDialog
+from .components.collection_list_model import CollectionListModel
+from .components.sorting_panel import sort_label
 from .timer_dialog import ViewingSettingsDialog
 from .collection_dialog import CollectionDialog
 from .loading_dialog import LoadingDialog
@@ -30,6 +35,64 @@ from .styles import create_standard_button, create_dialog_action_button, confirm
 from ..version import get_version
 
 
+@cache
+def _file_manager_cmd():
+    """Find the command used to open a folder in the file manager.
+
+    Resolved on first use and memoized, so the PATH probe runs at most once
+    per process and not at all for sessions that never open the folder.
+    """
+    if sys.platform == "win32":
+        return ("explorer",)
+    if sys.platform == "darwin":
+        return ("open",)
+    # Linux - first common file manager found on PATH
+    for fm in ("xdg-open", "nautilus", "dolphin", "thunar", "pcmanfm"):
+        if shutil.which(fm):
+            return (fm,)
+    return None
+
+
+# Display formats for the collection details panel
+_LAST_USED_FMT = "%B %d, %Y at %I:%M %p"
+_CREATED_FMT = "%B %d, %Y"
+
+
+@lru_cache(maxsize=256)
+def _format_timestamp(iso_timestamp, fmt):
+    """Format an ISO timestamp for display, or return None if it is invalid."""
+    try:
+        return datetime.fromisoformat(iso_timestamp).strftime(fmt)
+    except (TypeError, ValueError):
+        return None
+
+
+def _render_details_html(collection):
+    """Build the HTML shown in the collection details panel."""
+    parts = [
+        f"<b>{collection.name}</b><br><br>",
+        f"<b>Folders:</b> {len(collection.paths)}<br>",
+        f"<b>Total Images:</b> {collection.image_count}<br>",
+    ]
+
+    # Show sorting information
+    sort_method_display = sort_label(collection.sort_method, collection.sort_descending)
+    parts.append(f"<b>Sort Order:</b> {sort_method_display}<br>")
+    if collection.last_used:
+        last_used = _format_timestamp(collection.last_used, _LAST_USED_FMT)
+        if last_used:
+            parts.append(f"<b>Last Used:</b> {last_used}<br>")
+    if collection.created_date:
+        created = _format_timestamp(collection.created_date, _CREATED_FMT)
+        if created:
+            parts.append(f"<b>Created:</b> {created}<br>")
+
+    parts.append("<br><b>Folders:</b><br>")
+    parts.extend(f"• {path}<br>" for path in collection.paths)
+
+    return "".join(parts)
+
+
 class StartupDialog(CenteredDialog):
     """Startup dialog for managing collections and quick folder access."""
 
@@ -47,6 +110,18 @@ class StartupDialog(CenteredDialog):
         self.setWindowTitle(f"Glimpse v{get_version()}")
         self.resize(800, 600)
 
+        # Viewing settings dialog, built on first use and reused afterwards
+        self._viewing_settings_dialog = None
+
+        # Details rendering is debounced: a lone click renders immediately,
+        # while arrowing through the list only renders the collection the
+        # user stops on once the selection settles
+        self._pending_details = None
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(50)
+        self._details_timer.timeout.connect(self._render_pending_details)
+
         self.init_ui()
         self.refresh_collections()
         # Ensure no item is selected by default
@@ -76,7 +151,7 @@ class StartupDialog(CenteredDialog):
         # Subtitle
         subtitle = QLabel("Get random glimpses of your image collections")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("color: #666; font-size: 11px;")
+        subtitle.setObjectName("startupSubtitle")
         header_layout.addWidget(subtitle)
 
         layout.addWidget(header_widget)
@@ -92,13 +167,7 @@ class StartupDialog(CenteredDialog):
 
         # Custom collections group with title bar
         collections_group = QWidget()
-        collections_group.setStyleSheet("""
-            QWidget {
-                border: 1px solid #35383b;
-                border-radius: 4px;
-                background-color: #232629;
-            }
-        """)
+        collections_group.setObjectName("collectionsGroup")
         collections_group_layout = QVBoxLayout(collections_group)
         collections_group_layout.setContentsMargins(8, 8, 8, 8)
 
@@ -107,9 +176,7 @@ class StartupDialog(CenteredDialog):
         title_layout.setContentsMargins(0, 0, 0, 8)
 
         title_label = QLabel("Collections")
-        title_label.setStyleSheet(
-            "font-weight: bold; color: #b7bcc1; border: none; background: none;"
-        )
+        title_label.setObjectName("collectionsTitle")
         title_layout.addWidget(title_label)
 
         title_layout.addStretch()
@@ -123,37 +190,30 @@ class StartupDialog(CenteredDialog):
         collections_group_layout.addLayout(title_layout)
 
         # Collections list
-        self.collections_list = QListWidget()
+        self.collections_model = CollectionListModel(self)
+        self.collections_list = QListView()
+        self.collections_list.setModel(self.collections_model)
+        # Every row has the same padded single-line height, so Qt can size
+        # one row and skip measuring the rest
+        self.collections_list.setUniformItemSizes(True)
+        # Lay out large lists incrementally and don't auto-scroll while
+        # the user drags a selection
+        self.collections_list.setLayoutMode(QListView.Batched)
+        self.collections_list.setBatchSize(100)
+        self.collections_list.setAutoScroll(False)
         self.collections_list.setMinimumHeight(
             300
         )  # Increased from 200 for easier selection
         self.collections_list.setSizePolicy(
             QSizePolicy.Expanding, QSizePolicy.Expanding
         )
-        self.collections_list.itemDoubleClicked.connect(
-            self.on_collection_double_clicked
+        self.collections_list.doubleClicked.connect(self.on_collection_double_clicked)
+        self.collections_list.selectionModel().currentChanged.connect(
+            self._on_current_collection_changed
         )
-        self.collections_list.itemClicked.connect(self.on_collection_selected)
-
-        # Improve list item spacing and appearance - fixed version
-        self.collections_list.setStyleSheet("""
-            QListWidget {
-                outline: none;
-                show-decoration-selected: 1;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #35383b;
-                min-height: 20px;
-            }
-            QListWidget::item:hover {
-                background-color: #2e3034;
-            }
-            QListWidget::item:selected {
-                background-color: #354e6e;
-                color: white;
-            }
-        """)
+
+        # Item spacing and appearance come from DARK_STYLESHEET
+        self.collections_list.setObjectName("collectionsList")
 
         collections_group_layout.addWidget(self.collections_list)
 
@@ -194,7 +254,7 @@ class StartupDialog(CenteredDialog):
 
         quick_desc = QLabel("Quickly start viewing images from a single folder")
         quick_desc.setWordWrap(True)
-        quick_desc.setStyleSheet("color: #666; font-size: 11px; margin-top: 5px;")
+        quick_desc.setObjectName("quickStartHint")
         quick_layout.addWidget(quick_desc)
 
         right_layout.addWidget(quick_group)
@@ -203,11 +263,17 @@ class StartupDialog(CenteredDialog):
         details_group = QGroupBox("Collection Details")
         details_layout = QVBoxLayout(details_group)
 
-        self.details_text = QTextEdit()
-        self.details_text.setReadOnly(True)
-        self.details_text.setMinimumHeight(120)
-        self.details_text.setPlaceholderText("Select a collection to view details")
-        details_layout.addWidget(self.details_text)
+        # The QTextEdit is only built on the first selection; until then a
+        # plain label stands in for it
+        self._details_stack = QStackedWidget()
+        self._details_stack.setMinimumHeight(120)
+        self._details_placeholder = QLabel("Select a collection to view details")
+        self._details_placeholder.setObjectName("detailsPlaceholder")
+        self._details_placeholder.setAlignment(Qt.AlignCenter)
+        self._details_placeholder.setWordWrap(True)
+        self._details_stack.addWidget(self._details_placeholder)
+        self.details_text = None
+        details_layout.addWidget(self._details_stack)
 
         right_layout.addWidget(details_group, 1)  # Give it stretch factor
 
@@ -236,84 +302,89 @@ class StartupDialog(CenteredDialog):
 
     def refresh_collections(self):
         """Refresh the collections list."""
-        self.collections_list.clear()
         collections = self.collection_manager.get_all_collections()
+        # Applied as a diff; the model shows a placeholder row when empty.
+        # Repaint once after all row changes rather than after each one.
+        self.collections_list.setUpdatesEnabled(False)
+        try:
+            self.collections_model.set_collections(collections)
+        finally:
+            self.collections_list.setUpdatesEnabled(True)
+
+    def _current_collection(self):
+        """Return the collection for the current list row, if any."""
+        return self.collections_model.collection_at(
+            self.collections_list.currentIndex().row()
+        )
 
-        for collection in collections:
-            item = QListWidgetItem()
-            item.setText(f"{collection.name}")
-            item.setData(Qt.UserRole, collection)
-
-            # Add subtitle with path count and image count
-            subtitle = f"{len(collection.paths)} folder{'s' if len(collection.paths) != 1 else ''}, {collection.image_count} images"
-            item.setToolTip(f"{collection.name}\n{subtitle}")
-
-            self.collections_list.addItem(item)
+    def _select_collection_by_name(self, name):
+        """Make the collection with the given name the current row."""
+        row = self.collections_model.row_for_name(name)
+        if row is not None:
+            self.collections_list.setCurrentIndex(self.collections_model.index(row))
 
-        # Show message if no collections
-        if not collections:
-            item = QListWidgetItem(
-                "No collections found. Create your first collection!"
-            )
-            item.setFlags(Qt.NoItemFlags)  # Make it non-selectable
-            self.collections_list.addItem(item)
+    def _on_current_collection_changed(self, current, previous):
+        """Update details and buttons when the current row changes."""
+        self.on_collection_selected(current)
 
-    def on_collection_selected(self, item):
+    def on_collection_selected(self, index):
         """Handle collection selection."""
-        collection = item.data(Qt.UserRole)
+        collection = index.data(Qt.UserRole) if index.isValid() else None
         if collection:
-            self.open_collection_btn.setEnabled(True)
-            self.edit_collection_btn.setEnabled(True)
-            self.delete_collection_btn.setEnabled(True)
-
-            # Update details
-            details = f"<b>{collection.name}</b><br><br>"
-            details += f"<b>Folders:</b> {len(collection.paths)}<br>"
-            details += f"<b>Total Images:</b> {collection.image_count}<br>"
-
-            # Show sorting information
-            sort_display = {
-                "random": "Random (shuffle)",
-                "name": "Name (alphabetical)",
-                "path": "Full path",
-                "size": "File size",
-                "date": "Date modified",
-            }
-            sort_method_display = sort_display.get(
-                collection.sort_method, collection.sort_method
-            )
-            if collection.sort_method != "random" and collection.sort_descending:
-                sort_method_display += " (descending)"
-            details += f"<b>Sort Order:</b> {sort_method_display}<br>"
-            if collection.last_used:
-                from datetime import datetime
-
-                try:
-                    last_used = datetime.fromisoformat(collection.last_used)
-                    details += f"<b>Last Used:</b> {last_used.strftime('%B %d, %Y at %I:%M %p')}<br>"
-                except Exception:
-                    pass
-            if collection.created_date:
-                try:
-                    created = datetime.fromisoformat(collection.created_date)
-                    details += f"<b>Created:</b> {created.strftime('%B %d, %Y')}<br>"
-                except Exception:
-                    pass
-
-            details += "<br><b>Folders:</b><br>"
-            for path in collection.paths:
-                details += f"• {path}<br>"
-
-            self.details_text.setHtml(details)
+            self._set_selection_buttons(True)
+            if self._details_timer.isActive():
+                # Still within a burst of selection changes; defer
+                self._pending_details = collection
+            else:
+                self._show_collection_details(collection)
+            self._details_timer.start()
         else:
-            self.open_collection_btn.setEnabled(False)
-            self.edit_collection_btn.setEnabled(False)
-            self.delete_collection_btn.setEnabled(False)
+            self._set_selection_buttons(False)
+            self._pending_details = None
+            self._details_timer.stop()
+            self._clear_details()
+
+    def _render_pending_details(self):
+        """Show details for the most recently selected collection."""
+        collection = self._pending_details
+        self._pending_details = None
+        if collection is not None:
+            self._show_collection_details(collection)
+
+    def _show_collection_details(self, collection):
+        """Render collection into the details panel."""
+        # Details are rendered once per collection state and reused
+        if collection.details_html is None:
+            collection.details_html = _render_details_html(collection)
+        self._show_details_html(collection.details_html)
+
+    def _set_selection_buttons(self, enabled):
+        """Enable or disable the buttons that act on the selected collection."""
+        for button in (
+            self.open_collection_btn,
+            self.edit_collection_btn,
+            self.delete_collection_btn,
+        ):
+            button.setEnabled(enabled)
+
+    def _show_details_html(self, html):
+        """Show html in the details panel, creating the text view on first use."""
+        if self.details_text is None:
+            self.details_text = QTextEdit()
+            self.details_text.setReadOnly(True)
+            self._details_stack.addWidget(self.details_text)
+        self.details_text.setHtml(html)
+        self._details_stack.setCurrentWidget(self.details_text)
+
+    def _clear_details(self):
+        """Return the details panel to its placeholder."""
+        if self.details_text is not None:
             self.details_text.clear()
+        self._details_stack.setCurrentWidget(self._details_placeholder)
 
-    def on_collection_double_clicked(self, item):
+    def on_collection_double_clicked(self, index):
         """Handle double-click on collection item."""
-        collection = item.data(Qt.UserRole)
+        collection = index.data(Qt.UserRole)
         if collection:
             self.open_selected_collection()
 
@@ -361,69 +432,82 @@ class StartupDialog(CenteredDialog):
             QMessageBox.critical(self, "Error", "Collection already exists.")
             return
 
-        # Show loading dialog for image counting
-        loading_dialog = LoadingDialog(folders, self)
-
-        if loading_dialog.exec() == QDialog.Accepted:
-            # Get the loaded images and create collection
-            images = loading_dialog.get_images()
+        def on_scanned(image_count):
             collection = Collection(
                 name, folders, sort_method=sort_method, sort_descending=sort_descending
             )
-            collection.image_count = len(images)
+            collection.image_count = image_count
 
             if self.collection_manager.save_collection(collection):
                 self.refresh_collections()
-                # Select the new collection
-                for i in range(self.collections_list.count()):
-                    item = self.collections_list.item(i)
-                    if item.data(Qt.UserRole) and item.data(Qt.UserRole).name == name:
-                        self.collections_list.setCurrentItem(item)
-                        self.on_collection_selected(item)
-                        break
+                # Select the new collection (currentChanged updates the details)
+                self._select_collection_by_name(name)
             else:
                 QMessageBox.critical(self, "Error", "Failed to create collection.")
-        # If dialog was cancelled, just return without creating collection
 
-    def _update_collection_with_loading(self, collection):
-        """Update collection image count with loading dialog for progress indication."""
-        # Show loading dialog for image counting
-        loading_dialog = LoadingDialog(collection.paths, self)
+        # Count images in the background; if cancelled, nothing is created
+        self._scan_folders(folders, on_scanned)
 
-        if loading_dialog.exec() == QDialog.Accepted:
-            # Get the loaded images and update count
-            images = loading_dialog.get_images()
-            collection.image_count = len(images)
+    def _update_collection_with_loading(self, collection, old_name=None):
+        """Update collection image count with loading dialog for progress indication.
+
+        collection is an edited copy; the list and the manager's cache keep
+        the saved object until save_collection() swaps this one in. On a
+        rename, old_name is the file to remove once the new one is saved.
+        """
+
+        def on_scanned(image_count):
+            collection.image_count = image_count
+            collection.details_html = None
 
             if self.collection_manager.save_collection(collection):
+                # Only drop the old file once the renamed one is on disk, so
+                # a cancelled count or failed save never loses the collection
+                if old_name is not None and old_name != collection.name:
+                    self.collection_manager.delete_collection(old_name)
                 self.refresh_collections()
-                # Select the updated collection
-                for i in range(self.collections_list.count()):
-                    item = self.collections_list.item(i)
-                    if (
-                        item.data(Qt.UserRole)
-                        and item.data(Qt.UserRole).name == collection.name
-                    ):
-                        self.collections_list.setCurrentItem(item)
-                        self.on_collection_selected(item)
-                        break
+                # Select the updated collection (currentChanged updates the details)
+                self._select_collection_by_name(collection.name)
             else:
+                # Show what is actually on disk
+                self.refresh_collections()
                 QMessageBox.critical(self, "Error", "Failed to save collection.")
-        else:
-            # User cancelled loading, revert changes or show warning
+
+        def on_cancelled():
+            # Show what is actually on disk
+            self.refresh_collections()
             QMessageBox.information(
                 self,
                 "Update Cancelled",
                 "Collection update was cancelled. The collection was not saved.",
             )
 
-    def edit_selected_collection(self):
-        """Edit the selected collection using the comprehensive collection dialog."""
-        current = self.collections_list.currentItem()
-        if not current:
+        self._scan_folders(collection.paths, on_scanned, on_cancelled)
+
+    def _scan_folders(self, folders, on_finished, on_cancelled=None):
+        """Count the images in folders, then call on_finished(image_count).
+
+        Small folder sets are counted inline. Otherwise the scan runs in the
+        background behind a window-modal progress dialog and this returns
+        immediately; on_cancelled() runs if the user cancels it.
+        """
+        image_count, complete = self.collection_manager.count_images_fast(folders)
+        if complete:
+            on_finished(image_count)
             return
 
-        collection = current.data(Qt.UserRole)
+        loading_dialog = LoadingDialog(folders, self, count_only=True)
+        loading_dialog.accepted.connect(
+            lambda: on_finished(loading_dialog.get_image_count())
+        )
+        if on_cancelled:
+            loading_dialog.rejected.connect(on_cancelled)
+        loading_dialog.finished.connect(loading_dialog.deleteLater)
+        loading_dialog.open()
+
+    def edit_selected_collection(self):
+        """Edit the selected collection using the comprehensive collection dialog."""
+        collection = self._current_collection()
         if not collection:
             return
 
@@ -447,30 +531,24 @@ class StartupDialog(CenteredDialog):
                     )
                     return
 
-                # If name changed, delete old collection file
-                old_name = collection.name
-                if old_name != collection_data["name"]:
-                    self.collection_manager.delete_collection(old_name)
-
-                # Update collection with new data
-                collection.name = collection_data["name"]
-                collection.paths = collection_data["paths"]
-                collection.sort_method = collection_data["sort_method"]
-                collection.sort_descending = collection_data["sort_descending"]
+                # Apply the edits to a copy: the list model and the manager's
+                # cache share the original, which must stay as saved until
+                # the recount finishes and the copy is written
+                updated = Collection.from_dict(collection.to_dict())
+                updated.name = collection_data["name"]
+                updated.paths = collection_data["paths"]
+                updated.sort_method = collection_data["sort_method"]
+                updated.sort_descending = collection_data["sort_descending"]
 
                 # Update image count using loading dialog for large collections
-                self._update_collection_with_loading(collection)
+                self._update_collection_with_loading(updated, collection.name)
 
             except ValueError as e:
                 QMessageBox.warning(self, "Invalid Input", str(e))
 
     def delete_selected_collection(self):
         """Delete the selected collection."""
-        current = self.collections_list.currentItem()
-        if not current:
-            return
-
-        collection = current.data(Qt.UserRole)
+        collection = self._current_collection()
         if not collection:
             return
 
@@ -488,23 +566,17 @@ class StartupDialog(CenteredDialog):
             if self.collection_manager.delete_collection(collection.name):
                 self.refresh_collections()
                 # Clear details panel and disable buttons
-                self.details_text.clear()
-                self.open_collection_btn.setEnabled(False)
-                self.edit_collection_btn.setEnabled(False)
-                self.delete_collection_btn.setEnabled(False)
+                self._clear_details()
+                self._set_selection_buttons(False)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete collection.")
 
     def open_selected_collection(self):
         """Open the selected collection with viewing settings configuration."""
-        current = self.collections_list.currentItem()
-        if not current:
-            return
-
-        collection = current.data(Qt.UserRole)
+        collection = self._current_collection()
         if collection:
             # Show viewing settings dialog with collection's current settings
-            settings_dialog = ViewingSettingsDialog(self, collection)
+            settings_dialog = self._get_viewing_settings_dialog(collection)
             if settings_dialog.exec() == QDialog.Accepted:
                 timer_enabled, timer_interval = settings_dialog.get_timer_settings()
                 sort_method, sort_descending = settings_dialog.get_sorting_settings()
@@ -536,54 +608,55 @@ class StartupDialog(CenteredDialog):
                 self.accept()
             # If settings dialog was cancelled, just return (keep startup dialog open)
 
+    def _get_viewing_settings_dialog(self, collection=None):
+        """Return the shared viewing settings dialog, reset for collection."""
+        if self._viewing_settings_dialog is None:
+            self._viewing_settings_dialog = ViewingSettingsDialog(self, collection)
+        else:
+            self._viewing_settings_dialog.reset(collection)
+        return self._viewing_settings_dialog
+
     def show_collections_location(self):
         """Open the collections directory in the system file manager."""
         collections_dir = self.collection_manager.collections_dir
 
-        # Ensure the directory exists
-        if not os.path.exists(collections_dir):
-            os.makedirs(collections_dir, exist_ok=True)
+        # Ensure the directory exists (exist_ok makes a prior check redundant)
+        os.makedirs(collections_dir, exist_ok=True)
 
-        # Try to open in file manager using cross-platform approach
-        try:
-            if sys.platform == "win32":
-                # Windows - normalize path and use explorer
-                # Convert forward slashes to backslashes for Windows
-                win_path = os.path.normpath(collections_dir)
-                subprocess.run(["explorer", win_path], shell=False)
-            elif sys.platform == "darwin":
-                # macOS - use Finder
-                subprocess.run(["open", collections_dir], check=True)
-            else:
-                # Linux - try common file managers
-                file_managers = ["xdg-open", "nautilus", "dolphin", "thunar", "pcmanfm"]
-                for fm in file_managers:
-                    try:
-                        subprocess.run([fm, collections_dir], check=True)
-                        break
-                    except (subprocess.SubprocessError, FileNotFoundError):
-                        continue
-                else:
-                    # Fallback to Qt's desktop services
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(collections_dir))
-        except Exception as e:
-            # Fallback to Qt's desktop services first, then show message if that fails too
+        # Qt's desktop services use the platform opener directly
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(collections_dir)):
+            return
+
+        # Fall back to launching a known file manager ourselves
+        file_manager = _file_manager_cmd()
+        error = "no file manager found"
+        if file_manager is not None:
             try:
-                QDesktopServices.openUrl(QUrl.fromLocalFile(collections_dir))
-            except Exception:
-                QMessageBox.information(
-                    self,
-                    "Collections Location",
-                    f"Collections are stored in:\n{collections_dir}\n\n"
-                    f"(Could not open file manager: {str(e)})",
+                # normpath converts forward slashes to backslashes on Windows.
+                # Fire and forget: detach from our session and discard output.
+                subprocess.Popen(
+                    [*file_manager, os.path.normpath(collections_dir)],
+                    start_new_session=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                 )
+                return
+            except OSError as e:
+                error = str(e)
+
+        QMessageBox.information(
+            self,
+            "Collections Location",
+            f"Collections are stored in:\n{collections_dir}\n\n"
+            f"(Could not open file manager: {error})",
+        )
 
     def quick_shuffle_folder(self):
         """Quick shuffle a single folder with timer configuration."""
         folder = QFileDialog.getExistingDirectory(self, "Select folder to shuffle")
         if folder:
             # Show viewing settings dialog (no collection, so no sorting override options)
-            settings_dialog = ViewingSettingsDialog(self)
+            settings_dialog = self._get_viewing_settings_dialog()
             if settings_dialog.exec() == QDialog.Accepted:
                 timer_enabled, timer_interval = settings_dialog.get_timer_settings()
 
@@ -1,10 +1,49 @@
 """UI styling constants and themes."""
 
+from functools import cache
 from PySide6.QtWidgets import QPushButton, QDialog, QVBoxLayout, QHBoxLayout, QLabel
 from PySide6.QtCore import QEvent, Qt
 from ..core.image_utils import create_professional_icon
 
 
+# Semantic colors so confirm/cancel are instantly distinguishable at a glance
+_DIALOG_ICON_COLORS = {
+    "ok": "#4caf50",  # green – confirm / save
+    "cancel": "#f44336",  # red   – cancel / discard
+    "delete": "#f44336",  # red   – destructive
+    "play": "#4caf50",  # green – start / open
+}
+
+
+@cache
+def _button_icon(icon_name: str, size: int, color: str):
+    """Render a button icon once per (name, size, color) and share it.
+
+    QIcon is implicitly shared, so handing the same instance to several
+    buttons is safe and skips re-rasterizing the SVG for every button. The
+    key space is the app's fixed icon set times two sizes and a few colors,
+    so the cache is unbounded: nothing is ever evicted and re-rendered.
+    """
+    return create_professional_icon(icon_name, size, color)
+
+
+class _IconButton(QPushButton):
+    """Push button that swaps to a dimmed icon while disabled."""
+
+    def __init__(self, text: str, enabled_icon, disabled_icon):
+        super().__init__(text)
+        self._enabled_icon = enabled_icon
+        self._disabled_icon = disabled_icon
+        self.setIcon(enabled_icon)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.EnabledChange:
+            self.setIcon(
+                self._enabled_icon if self.isEnabled() else self._disabled_icon
+            )
+        super().changeEvent(event)
+
+
 def confirm_dialog(
     parent,
     title: str,
@@ -15,6 +54,8 @@ def confirm_dialog(
 ) -> bool:
     """Show a styled Yes/No confirmation dialog. Returns True if confirmed."""
     dlg = QDialog(parent)
+    # Only the exec() result is needed, so don't keep the dialog as a child
+    dlg.setAttribute(Qt.WA_DeleteOnClose, True)
     dlg.setWindowTitle(title)
     dlg.setModal(True)
     dlg.setMinimumWidth(340)
@@ -40,29 +81,14 @@ def confirm_dialog(
         confirm_text, primary=not destructive, icon_name=confirm_icon
     )
     if destructive:
-        confirm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c62828;
-                color: white;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 6px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #b71c1c; }
-            QPushButton:pressed { background-color: #8e0000; }
-        """)
+        confirm_btn.setObjectName("dlgDestructive")
     confirm_btn.clicked.connect(dlg.accept)
     btn_row.addWidget(confirm_btn)
 
     layout.addLayout(btn_row)
 
-    # Apply dark theme to match app style
-    dlg.setStyleSheet("""
-        QDialog { background-color: #2b2d30; }
-        QLabel { color: #d4d4d4; font-size: 12px; }
-    """)
+    # Dark theme comes from the QDialog#confirmDialog rules in DARK_STYLESHEET
+    dlg.setObjectName("confirmDialog")
 
     return dlg.exec() == QDialog.Accepted
 
@@ -71,92 +97,21 @@ def create_standard_button(
     text: str, icon_name: str = None, large: bool = False
 ) -> QPushButton:
     """Create a standard button with consistent styling."""
-    button = QPushButton(text)
-
-    # Set consistent size and styling with clear enabled/disabled states
-    if large:
-        button.setMinimumHeight(40)
-        button.setStyleSheet("""
-            QPushButton {
-                font-size: 13px;
-                font-weight: 500;
-                padding: 8px 16px;
-                border-radius: 6px;
-                background-color: #404244;
-                color: #ffffff;
-                border: 1px solid #606264;
-            }
-            QPushButton:hover {
-                background-color: #4a4c4e;
-                border: 1px solid #707274;
-            }
-            QPushButton:pressed {
-                background-color: #363638;
-                border: 1px solid #505254;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-                border: 1px solid #404040;
-            }
-        """)
-    else:
-        button.setMinimumHeight(32)
-        button.setStyleSheet("""
-            QPushButton {
-                font-size: 12px;
-                padding: 6px 12px;
-                border-radius: 4px;
-                background-color: #404244;
-                color: #ffffff;
-                border: 1px solid #606264;
-            }
-            QPushButton:hover {
-                background-color: #4a4c4e;
-                border: 1px solid #707274;
-            }
-            QPushButton:pressed {
-                background-color: #363638;
-                border: 1px solid #505254;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-                border: 1px solid #404040;
-            }
-        """)
-
     # Add icon if specified with disabled state support
     if icon_name:
-        # Create both enabled and disabled icons
-        enabled_icon = create_professional_icon(icon_name, 16, "#ffffff")
-        disabled_icon = create_professional_icon(icon_name, 16, "#666666")
-
-        # Set the enabled icon
-        button.setIcon(enabled_icon)
-
-        # Store disabled icon for state changes
-        button._disabled_icon = disabled_icon
-        button._enabled_icon = enabled_icon
-
-        # Override changeEvent to handle icon state changes
-        original_change_event = button.changeEvent
-
-        def change_event_handler(event):
-            if event.type() == QEvent.Type.EnabledChange:
-                if button.isEnabled():
-                    button.setIcon(button._enabled_icon)
-                else:
-                    button.setIcon(button._disabled_icon)
-            original_change_event(event)
-
-        button.changeEvent = change_event_handler
-
-        # Add consistent spacing between icon and text - larger for big buttons
-        spacing = "12px" if large else "10px"
-        button.setStyleSheet(
-            button.styleSheet() + f"text-align: left; padding-left: {spacing};"
+        button = _IconButton(
+            text,
+            _button_icon(icon_name, 16, "#ffffff"),
+            _button_icon(icon_name, 16, "#666666"),
         )
+    else:
+        button = QPushButton(text)
+
+    # Set consistent size and styling with clear enabled/disabled states
+    button.setMinimumHeight(40 if large else 32)
+    # Styled by the QPushButton#stdBtn* rules in DARK_STYLESHEET
+    button.setObjectName("stdBtnLarge" if large else "stdBtn")
+    button.setProperty("hasIcon", bool(icon_name))
 
     return button
 
@@ -165,86 +120,21 @@ def create_dialog_action_button(
     text: str, primary: bool = False, icon_name: str = None
 ) -> QPushButton:
     """Create a dialog action button (OK, Cancel, etc.) with consistent styling."""
-    button = QPushButton(text)
-    button.setMinimumHeight(32)
-    button.setMinimumWidth(80)
-
     # Add icon if specified with disabled state support
     if icon_name:
-        # Semantic colors so confirm/cancel are instantly distinguishable at a glance
-        _ICON_COLORS = {
-            "ok": "#4caf50",  # green – confirm / save
-            "cancel": "#f44336",  # red   – cancel / discard
-            "delete": "#f44336",  # red   – destructive
-            "play": "#4caf50",  # green – start / open
-        }
-        icon_color = _ICON_COLORS.get(icon_name, "#ffffff")
-        enabled_icon = create_professional_icon(icon_name, 18, icon_color)
-        disabled_icon = create_professional_icon(icon_name, 18, "#555555")
-
-        button.setIcon(enabled_icon)
-        button._disabled_icon = disabled_icon
-        button._enabled_icon = enabled_icon
-
-        original_change_event = button.changeEvent
-
-        def change_event_handler(event):
-            if event.type() == QEvent.Type.EnabledChange:
-                if button.isEnabled():
-                    button.setIcon(button._enabled_icon)
-                else:
-                    button.setIcon(button._disabled_icon)
-            original_change_event(event)
-
-        button.changeEvent = change_event_handler
-
-    if primary:
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 6px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #888888;
-                border: 1px solid #505050;
-            }
-        """)
+        icon_color = _DIALOG_ICON_COLORS.get(icon_name, "#ffffff")
+        button = _IconButton(
+            text,
+            _button_icon(icon_name, 18, icon_color),
+            _button_icon(icon_name, 18, "#555555"),
+        )
     else:
-        button.setStyleSheet("""
-            QPushButton {
-                font-size: 12px;
-                padding: 6px 16px;
-                border-radius: 4px;
-                background-color: #404244;
-                color: #ffffff;
-                border: 1px solid #606264;
-            }
-            QPushButton:hover {
-                background-color: #4a4c4e;
-                border: 1px solid #707274;
-            }
-            QPushButton:pressed {
-                background-color: #363638;
-                border: 1px solid #505254;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-                border: 1px solid #404040;
-            }
-        """)
+        button = QPushButton(text)
+    button.setMinimumHeight(32)
+    button.setMinimumWidth(80)
+
+    # Styled by the QPushButton#dlg* rules in DARK_STYLESHEET
+    button.setObjectName("dlgPrimary" if primary else "dlgBtn")
 
     return button
 
@@ -276,4 +166,136 @@ QToolBar {
     border: none;
     background: #232629; /* or your preferred color */
 }
+
+/* Startup dialog */
+QLabel#startupSubtitle { color: #666; font-size: 11px; }
+QLabel#quickStartHint { color: #666; font-size: 11px; margin-top: 5px; }
+QLabel#detailsPlaceholder { color: #666; }
+/* Only the frame and its list: a descendant-QWidget rule would outrank the
+   QPushButton#stdBtn rules below and strip the buttons' fill and border */
+QWidget#collectionsGroup, QWidget#collectionsGroup QListView {
+    border: 1px solid #35383b;
+    border-radius: 4px;
+    background-color: #232629;
+}
+QWidget#collectionsGroup QLabel#collectionsTitle {
+    font-weight: bold;
+    color: #b7bcc1;
+    border: none;
+    background: none;
+}
+QListView#collectionsList, QListView#foldersList {
+    outline: none;
+    show-decoration-selected: 1;
+}
+QListView#collectionsList::item, QListView#foldersList::item {
+    padding: 8px;
+    border-bottom: 1px solid #35383b;
+    min-height: 20px;
+}
+QListView#collectionsList::item:hover, QListView#foldersList::item:hover {
+    background-color: #2e3034;
+}
+QListView#collectionsList::item:selected, QListView#foldersList::item:selected {
+    background-color: #354e6e;
+    color: white;
+}
+
+/* Collection dialog and sorting panel */
+QLabel#foldersLabel { font-weight: bold; margin-top: 10px; }
+QLabel#timerHint { color: #666; font-size: 11px; }
+QLabel#sortingInfo { color: #666; font-size: 11px; margin-bottom: 5px; }
+QComboBox#sortOrderCombo:disabled {
+    background-color: #1e1e1e;
+    color: #666666;
+    border: 1px solid #333333;
+}
+
+/* Loading dialog */
+QLabel#loadingInfo { color: #888888; }
+QProgressBar#loadingProgress {
+    border: 1px solid #555555;
+    border-radius: 3px;
+    background-color: #2b2b2b;
+    text-align: center;
+    color: white;
+}
+QProgressBar#loadingProgress::chunk {
+    background-color: #0078d4;
+    border-radius: 2px;
+}
+
+/* confirm_dialog */
+QDialog#confirmDialog { background-color: #2b2d30; }
+QDialog#confirmDialog QLabel { color: #d4d4d4; font-size: 12px; }
+
+/* Buttons from create_standard_button / create_dialog_action_button */
+QPushButton#stdBtn, QPushButton#stdBtnLarge, QPushButton#dlgBtn {
+    background-color: #404244;
+    color: #ffffff;
+    border: 1px solid #606264;
+}
+QPushButton#stdBtn:hover, QPushButton#stdBtnLarge:hover, QPushButton#dlgBtn:hover {
+    background-color: #4a4c4e;
+    border: 1px solid #707274;
+}
+QPushButton#stdBtn:pressed, QPushButton#stdBtnLarge:pressed, QPushButton#dlgBtn:pressed {
+    background-color: #363638;
+    border: 1px solid #505254;
+}
+QPushButton#stdBtn:disabled, QPushButton#stdBtnLarge:disabled, QPushButton#dlgBtn:disabled {
+    background-color: #2a2a2a;
+    color: #666666;
+    border: 1px solid #404040;
+}
+QPushButton#stdBtn { font-size: 12px; padding: 6px 12px; border-radius: 4px; }
+QPushButton#stdBtnLarge {
+    font-size: 13px;
+    font-weight: 500;
+    padding: 8px 16px;
+    border-radius: 6px;
+}
+QPushButton#dlgBtn { font-size: 12px; padding: 6px 16px; border-radius: 4px; }
+/* Icon buttons get extra spacing between icon and text - larger for big buttons */
+QPushButton#stdBtn[hasIcon="true"] { text-align: left; padding-left: 10px; }
+QPushButton#stdBtnLarge[hasIcon="true"] { text-align: left; padding-left: 12px; }
+QPushButton#dlgPrimary {
+    background-color: #0078d4;
+    color: white;
+    font-size: 12px;
+    font-weight: 500;
+    padding: 6px 16px;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton#dlgPrimary:hover { background-color: #106ebe; }
+QPushButton#dlgPrimary:pressed { background-color: #005a9e; }
+QPushButton#dlgPrimary:disabled {
+    background-color: #404040;
+    color: #888888;
+    border: 1px solid #505050;
+}
+QPushButton#dlgDestructive {
+    background-color: #c62828;
+    color: white;
+    font-size: 12px;
+    font-weight: 500;
+    padding: 6px 16px;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton#dlgDestructive:hover { background-color: #b71c1c; }
+QPushButton#dlgDestructive:pressed { background-color: #8e0000; }
 """
+
+
+def apply_global_style(app):
+    """Apply DARK_STYLESHEET to the whole application.
+
+    Call once at startup. Widgets are styled through object names and
+    dynamic properties matched by this sheet rather than per-widget sheets,
+    so Qt parses the rules a single time and shares them across widgets.
+    Calling it again is a no-op when the sheet is already applied.
+    """
+    if app.styleSheet() != DARK_STYLESHEET:
+        app.setStyleSheet(DARK_STYLESHEET)
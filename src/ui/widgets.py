@@ -1,63 +1,191 @@
 """Custom UI widgets for the image viewer."""
 
+import math
 import time
+import weakref
+from functools import cache
 from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QPushButton
-from PySide6.QtGui import QPainter, QColor, QPen, QLinearGradient, QIcon, QPixmap
-from PySide6.QtCore import Qt, QTimer, QSize, Signal, QRect
+from PySide6.QtGui import (
+    QPainter,
+    QColor,
+    QPen,
+    QBrush,
+    QGradient,
+    QLinearGradient,
+    QIcon,
+    QPixmap,
+    QGuiApplication,
+)
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QSize,
+    Signal,
+    Slot,
+    QRect,
+    QObject,
+    QEvent,
+)
+
+# Countdown animations tick at ~30 FPS; smoothing is time-based, so the
+# rate only affects granularity, not how fast the value catches up
+ANIMATION_INTERVAL_MS = 33
+# Time constant of the exponential smoothing, in seconds. Matches the old
+# fixed 0.18-per-16 ms step: 0.016 / -ln(1 - 0.18) ~= 0.08
+SMOOTHING_TAU = 0.08
+
+
+def smoothing_alpha(dt):
+    """Exponential smoothing factor for a tick that took dt seconds."""
+    return 1.0 - math.exp(-max(0.0, dt) / SMOOTHING_TAU)
+
+
+class _AnimationDriver(QObject):
+    """Single ticker shared by all countdown widgets.
+
+    Widgets subscribe when their target value moves and are dropped once
+    their ``_advance(dt)`` reports they have settled, so the timer only
+    runs while something is actually animating and never more than once
+    per frame however many countdowns are visible.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide driver, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._subscribers = weakref.WeakSet()
+        self._last_tick = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(ANIMATION_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_tick)
 
+    def subscribe(self, widget):
+        """Advance widget on every tick until it settles."""
+        self._subscribers.add(widget)
+        if not self._timer.isActive():
+            # Restart the clock so the first tick doesn't see the idle gap
+            self._last_tick = time.monotonic()
+            self._timer.start()
 
-class CircularCountdown(QWidget):
-    """A circular countdown timer widget with smooth animation."""
+    def unsubscribe(self, widget):
+        """Stop advancing widget; the timer stops with the last subscriber."""
+        self._subscribers.discard(widget)
+        if not self._subscribers:
+            self._timer.stop()
 
-    def __init__(self, total_time=0, parent=None):
+    @Slot()
+    def _on_tick(self):
+        """Advance every subscriber by the real time since the last tick."""
+        now = time.monotonic()
+        dt = now - self._last_tick
+        self._last_tick = now
+        for widget in list(self._subscribers):
+            try:
+                animating = widget._advance(dt)
+            except RuntimeError:
+                # Underlying C++ widget already deleted
+                animating = False
+            if not animating:
+                self._subscribers.discard(widget)
+        if not self._subscribers:
+            self._timer.stop()
+
+
+class _SmoothCountdownBase(QWidget):
+    """Countdown state and smoothing shared by the countdown widgets.
+
+    remaining_time is the actual time left; displayed_time eases toward it
+    on the shared _AnimationDriver and is what subclasses paint.
+    """
+
+    def __init__(self, parent=None):
         super().__init__(parent)
         self.total_time = 0
         self.remaining_time = 0  # The actual time left
         self.displayed_time = 0  # The smooth UI value
-        self.setFixedSize(QSize(24, 24))
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_tick)
-        # Don't start timer immediately - start only when needed
-
-        self._last_update = time.monotonic()
 
     def set_total_time(self, seconds):
         """Set the total countdown time."""
-        self.total_time = float(max(1, seconds))
+        total = float(max(1, seconds))
+        if total == self.total_time:
+            return
+        self.total_time = total
         self.update()
 
     def set_remaining_time(self, seconds):
         """Set the remaining countdown time."""
-        self.remaining_time = float(max(0, min(self.total_time, seconds)))
-        # Start timer for smooth animation
-        if not self._timer.isActive():
-            self._timer.start(16)  # 60 FPS for smooth animation
-        self.update()
-
-    def _on_tick(self):
-        """Smooth animation tick handler."""
+        remaining = float(max(0, min(self.total_time, seconds)))
+        if remaining == self.remaining_time:
+            return
+        self.remaining_time = remaining
+        # Animate toward the new value on the shared ticker; paints are
+        # scheduled from there with update(), never repaint()
+        _AnimationDriver.instance().subscribe(self)
+
+    def _advance(self, dt):
+        """Move displayed_time toward remaining_time; False once settled."""
         # Interpolate displayed_time toward remaining_time
-        alpha = 0.18  # Smoothing factor (smaller = smoother/slower)
-        self.displayed_time += (self.remaining_time - self.displayed_time) * alpha
+        self.displayed_time += (
+            self.remaining_time - self.displayed_time
+        ) * smoothing_alpha(dt)
         if abs(self.displayed_time - self.remaining_time) < 0.01:
             self.displayed_time = self.remaining_time
-        self.update()
+        # Hidden (e.g. auto-hidden overlay) or fully clipped: nothing to
+        # repaint; showing the widget again paints the current value
+        if self.isVisible() and not self.visibleRegion().isEmpty():
+            self.update()
+        # Settled: stop ticking until set_remaining_time() moves the target
+        return self.displayed_time != self.remaining_time
+
+    def stop_animation(self):
+        """Stop animating and jump to the current value."""
+        _AnimationDriver.instance().unsubscribe(self)
+        self.displayed_time = self.remaining_time
+
+    def hideEvent(self, event):
+        """Stop animating while hidden; nothing would be drawn."""
+        self.stop_animation()
+        super().hideEvent(event)
+
+
+class CircularCountdown(_SmoothCountdownBase):
+    """A circular countdown timer widget with smooth animation."""
+
+    # Paint resources are immutable, so build them once for all instances
+    _RING_PEN = QPen(QColor("#3d3e40"), 2)
+    _ARC_PEN = QPen(QColor("#80b2ff"), 3)
+
+    def __init__(self, total_time=0, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(QSize(24, 24))
+        self._draw_rect = self.rect().adjusted(4, 4, -4, -4)
+
+    def resizeEvent(self, event):
+        """Recompute the ring rectangle for the new size."""
+        self._draw_rect = self.rect().adjusted(4, 4, -4, -4)
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         """Paint the circular countdown progress."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        rect = self.rect().adjusted(4, 4, -4, -4)
         # Draw subtle background ring
-        painter.setPen(QPen(QColor("#3d3e40"), 2))
+        painter.setPen(self._RING_PEN)
         painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(rect)
+        painter.drawEllipse(self._draw_rect)
         # Draw smooth progress arc
         if self.total_time > 0 and self.displayed_time > 0:
             fraction = self.displayed_time / self.total_time
             angle = int(360 * 16 * fraction)
-            painter.setPen(QPen(QColor("#80b2ff"), 3))
-            painter.drawArc(rect, 90 * 16, -angle)
+            painter.setPen(self._ARC_PEN)
+            painter.drawArc(self._draw_rect, 90 * 16, -angle)
 
 
 class ClickableLabel(QLabel):
@@ -69,7 +197,7 @@ class ClickableLabel(QLabel):
     forward = Signal()
     wheel_zoom = Signal(float)  # Signal for zooming, emits delta
     pan_start = Signal(object)  # Signal for starting pan (QPoint)
-    pan_move = Signal(object)  # Signal for pan movement (QPoint)
+    pan_move = Signal(int, int)  # Signal for pan movement (dx, dy)
     pan_end = Signal()  # Signal for ending pan
     mouse_moved = Signal()  # Signal for mouse movement to show controls
 
@@ -77,8 +205,40 @@ class ClickableLabel(QLabel):
         super().__init__(*args, **kwargs)
         self._is_panning = False
         self._last_pan_point = None
-        # Enable mouse tracking to receive move events during drag
-        self.setMouseTracking(True)
+        # Drags deliver move events regardless; hover moves (no button held)
+        # are only tracked once a mouse_moved user asks for them, and only
+        # while this window is active, see set_hover_tracking()
+        self._hover_tracking = False
+        # Window activation isn't sent to child widgets, so follow the
+        # application's focus window instead
+        QGuiApplication.instance().focusWindowChanged.connect(
+            self._apply_hover_tracking
+        )
+
+        # mouse_moved only drives show-controls, so emit it at most once per
+        # frame: emit on the first move, then ignore moves until this expires
+        self._move_emit_timer = QTimer(self)
+        self._move_emit_timer.setSingleShot(True)
+        self._move_emit_timer.setInterval(16)
+
+    def set_hover_tracking(self, enabled):
+        """Emit mouse_moved for moves without a pressed button as well.
+
+        Takes effect only while the label's window is active; when another
+        application or a modal dialog has focus, hover moves are not
+        delivered at all.
+        """
+        self._hover_tracking = enabled
+        self._apply_hover_tracking()
+
+    def _apply_hover_tracking(self, focus_window=None):
+        """Sync Qt mouse tracking with the request and window activation."""
+        if focus_window is None:
+            focus_window = QGuiApplication.focusWindow()
+        active = (
+            focus_window is not None and focus_window == self.window().windowHandle()
+        )
+        self.setMouseTracking(self._hover_tracking and active)
 
     def mousePressEvent(self, event):
         """Handle mouse press events."""
@@ -97,13 +257,19 @@ class ClickableLabel(QLabel):
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events for panning and show controls."""
-        # Emit signal for showing controls on mouse movement
-        self.mouse_moved.emit()
+        # Emit signal for showing controls on mouse movement (throttled)
+        if not self._move_emit_timer.isActive():
+            self._move_emit_timer.start()
+            self.mouse_moved.emit()
 
         if self._is_panning and self._last_pan_point:
-            delta = event.pos() - self._last_pan_point
-            self.pan_move.emit(delta)
-            self._last_pan_point = event.pos()
+            pos = event.pos()
+            dx = pos.x() - self._last_pan_point.x()
+            dy = pos.y() - self._last_pan_point.y()
+            # Positions are whole pixels; skip moves that didn't change one
+            if dx or dy:
+                self.pan_move.emit(dx, dy)
+                self._last_pan_point = pos
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -123,74 +289,70 @@ class ClickableLabel(QLabel):
         super().wheelEvent(event)
 
 
-class MinimalProgressBar(QWidget):
+class MinimalProgressBar(_SmoothCountdownBase):
     """A minimal semi-transparent progress bar for the bottom of the window."""
 
+    # Very subtle semi-transparent background
+    _BG_COLOR = QColor(0, 0, 0, round(0.1 * 255))
+    # Subtle gradient for the progress; ObjectMode stretches it over whatever
+    # rectangle is filled, so one brush serves every progress width
+    _PROGRESS_GRADIENT = QLinearGradient(0, 0, 1, 0)
+    _PROGRESS_GRADIENT.setCoordinateMode(QGradient.ObjectMode)
+    _PROGRESS_GRADIENT.setColorAt(0, QColor(0x80, 0xB2, 0xFF, round(0.6 * 255)))
+    _PROGRESS_GRADIENT.setColorAt(1, QColor(0x4A, 0x90, 0xE2, round(0.4 * 255)))
+    _PROGRESS_BRUSH = QBrush(_PROGRESS_GRADIENT)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.total_time = 0
-        self.remaining_time = 0
-        self.displayed_time = 0
         self.setFixedHeight(4)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
-
-        # Smooth animation timer - don't start immediately
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_tick)
-
-    def set_total_time(self, seconds):
-        """Set the total countdown time."""
-        self.total_time = float(max(1, seconds))
-        self.update()
-
-    def set_remaining_time(self, seconds):
-        """Set the remaining countdown time."""
-        self.remaining_time = float(max(0, min(self.total_time, seconds)))
-        # Start timer for smooth animation
-        if not self._timer.isActive():
-            self._timer.start(16)  # 60 FPS for smooth animation
-        self.update()
-
-    def _on_tick(self):
-        """Smooth animation tick handler."""
-        alpha = 0.18  # Smoothing factor
-        self.displayed_time += (self.remaining_time - self.displayed_time) * alpha
-        if abs(self.displayed_time - self.remaining_time) < 0.01:
-            self.displayed_time = self.remaining_time
-        self.update()
+        # Full-width rendering of the gradient, rebuilt only on width changes
+        self._gradient_pixmap = None
+
+    def resizeEvent(self, event):
+        """Drop the cached gradient when the bar's width changes."""
+        if event.size().width() != event.oldSize().width():
+            self._gradient_pixmap = None
+        super().resizeEvent(event)
+
+    def _gradient(self):
+        """Return the progress gradient rasterized once at the current width.
+
+        The gradient only varies horizontally, so a one-pixel-high strip is
+        enough; it is stretched over the progress rectangle when painting.
+        """
+        if self._gradient_pixmap is None:
+            pixmap = QPixmap(max(1, self.width()), 1)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.fillRect(pixmap.rect(), self._PROGRESS_BRUSH)
+            painter.end()
+            self._gradient_pixmap = pixmap
+        return self._gradient_pixmap
 
     def paintEvent(self, event):
         """Paint the minimal progress bar."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
 
         rect = self.rect()
+        painter.fillRect(rect, self._BG_COLOR)
 
-        # Draw very subtle semi-transparent background
-        bg_color = QColor("#000000")
-        bg_color.setAlphaF(0.1)  # Much more subtle
-        painter.fillRect(rect, bg_color)
-
-        # Draw progress
+        # Draw progress: blit the cached gradient squeezed into the filled
+        # part, which keeps the full gradient visible at any progress
         if self.total_time > 0 and self.displayed_time > 0:
             fraction = self.displayed_time / self.total_time
             progress_width = int(rect.width() * fraction)
             progress_rect = QRect(0, 0, progress_width, rect.height())
-
-            # Create more subtle gradient for progress bar
-            gradient = QLinearGradient(0, 0, progress_width, 0)
-            progress_color_1 = QColor("#80b2ff")
-            progress_color_1.setAlphaF(0.6)  # Reduced opacity
-            progress_color_2 = QColor("#4a90e2")
-            progress_color_2.setAlphaF(0.4)  # Reduced opacity
-            gradient.setColorAt(0, progress_color_1)
-            gradient.setColorAt(1, progress_color_2)
-
-            painter.fillRect(progress_rect, gradient)
+            painter.drawPixmap(progress_rect, self._gradient())
 
 
+@cache
 def create_simple_icon(symbol, size=24, color="#ffffff"):
-    """Create a simple icon from a text symbol."""
+    """Create a simple icon from a text symbol.
+
+    Cached per (symbol, size, color); QIcon is implicitly shared, so
+    handing the same instance to several widgets is safe.
+    """
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
@@ -201,6 +363,30 @@ def create_simple_icon(symbol, size=24, color="#ffffff"):
     return QIcon(pixmap)
 
 
+@cache
+def _overlay_icons(icon_type, size=18, color="#ffffff", opacity=0.7):
+    """Return the (dimmed base, full-opacity hover) icons for an overlay button.
+
+    Cached per icon so new overlays and play/pause toggles reuse the
+    rendered pixmaps instead of painting them again.
+    """
+    from ..core.image_utils import create_professional_icon
+
+    hover_icon = create_professional_icon(icon_type, size, color)
+
+    # Dim a copy of the pixmap for the resting state
+    base_pixmap = hover_icon.pixmap(size, size)
+    transparent_pixmap = QPixmap(size, size)
+    transparent_pixmap.fill(Qt.transparent)
+
+    painter = QPainter(transparent_pixmap)
+    painter.setOpacity(opacity)
+    painter.drawPixmap(0, 0, base_pixmap)
+    painter.end()
+
+    return QIcon(transparent_pixmap), hover_icon
+
+
 class ButtonOverlay(QWidget):
     """Semi-transparent button overlay for bottom middle of the image viewer."""
 
@@ -211,6 +397,51 @@ class ButtonOverlay(QWidget):
     zoom_in_clicked = Signal()
     zoom_out_clicked = Signal()
 
+    # Background opacity at rest and on hover
+    base_opacity = 0.15
+    hover_opacity = 0.5
+
+    # (attribute, icon, relayed signal) in layout order, zoom buttons on the
+    # sides; all buttons are the same size
+    _BUTTONS = (
+        ("zoom_out_btn", "zoom_out", "zoom_out_clicked"),
+        ("prev_btn", "skip_previous", "previous_clicked"),
+        ("pause_btn", "pause", "pause_clicked"),
+        ("stop_btn", "stop", "stop_clicked"),
+        ("next_btn", "skip_next", "next_clicked"),
+        ("zoom_in_btn", "zoom_in", "zoom_in_clicked"),
+    )
+
+    # Formatted once at import and shared by every overlay
+    _STYLESHEET = f"""
+        ButtonOverlay {{
+            background-color: rgba(0, 0, 0, {round(base_opacity * 255)});
+            border-radius: 25px;
+        }}
+        ButtonOverlay:hover {{
+            background-color: rgba(0, 0, 0, {round(hover_opacity * 255)});
+        }}
+        QPushButton {{
+            background: transparent;
+            border: none;
+            color: #ffffff;
+            font-size: 16px;
+            padding: 0px;
+            border-radius: 20px;
+            min-width: 40px;
+            min-height: 40px;
+            text-align: center;
+        }}
+        QPushButton:hover {{
+            background-color: rgba(255, 255, 255, 30);
+            color: #ffffff;
+        }}
+        QPushButton:pressed {{
+            background-color: rgba(255, 255, 255, 50);
+            color: #ffffff;
+        }}
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_StyledBackground)
@@ -228,159 +459,36 @@ class ButtonOverlay(QWidget):
         self.setMouseTracking(True)
 
         # Initially semi-transparent
-        self.base_opacity = 0.15  # Background opacity
-        self.hover_opacity = 0.5  # Background opacity on hover
-        self.setStyleSheet("""
-            ButtonOverlay {
-                background-color: rgba(0, 0, 0, 38);
-                border-radius: 25px;
-            }
-            ButtonOverlay:hover {
-                background-color: rgba(0, 0, 0, 128);
-            }
-            QPushButton {
-                background: transparent;
-                border: none;
-                color: #ffffff;
-                font-size: 16px;
-                padding: 0px;
-                border-radius: 20px;
-                min-width: 40px;
-                min-height: 40px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 30);
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 50);
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
         # Create layout
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
 
-        # Import the icon function
-        from ..core.image_utils import create_professional_icon
-
-        # Create buttons with professional geometric icons (all same size)
-        icon_size = 18  # Consistent size for all icons
-        # Use solid white and apply opacity to the pixmaps directly
-        icon_color = "#ffffff"
-
-        # Create base icons with transparency applied to pixmap
-        self.prev_btn = QPushButton()
-        self.prev_btn._base_icon = self._create_transparent_icon(
-            "skip_previous", icon_size, icon_color, 0.7
-        )
-        self.prev_btn._hover_icon = create_professional_icon(
-            "skip_previous", icon_size, icon_color
-        )
-        self.prev_btn.setIcon(self.prev_btn._base_icon)
-        self.prev_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        self.pause_btn = QPushButton()
-        self.pause_btn._base_icon = self._create_transparent_icon(
-            "pause", icon_size, icon_color, 0.7
-        )
-        self.pause_btn._hover_icon = create_professional_icon(
-            "pause", icon_size, icon_color
-        )
-        self.pause_btn.setIcon(self.pause_btn._base_icon)
-        self.pause_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        self.stop_btn = QPushButton()
-        self.stop_btn._base_icon = self._create_transparent_icon(
-            "stop", icon_size, icon_color, 0.7
-        )
-        self.stop_btn._hover_icon = create_professional_icon(
-            "stop", icon_size, icon_color
-        )
-        self.stop_btn.setIcon(self.stop_btn._base_icon)
-        self.stop_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        self.next_btn = QPushButton()
-        self.next_btn._base_icon = self._create_transparent_icon(
-            "skip_next", icon_size, icon_color, 0.7
-        )
-        self.next_btn._hover_icon = create_professional_icon(
-            "skip_next", icon_size, icon_color
-        )
-        self.next_btn.setIcon(self.next_btn._base_icon)
-        self.next_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        self.zoom_out_btn = QPushButton()
-        self.zoom_out_btn._base_icon = self._create_transparent_icon(
-            "zoom_out", icon_size, icon_color, 0.7
-        )
-        self.zoom_out_btn._hover_icon = create_professional_icon(
-            "zoom_out", icon_size, icon_color
-        )
-        self.zoom_out_btn.setIcon(self.zoom_out_btn._base_icon)
-        self.zoom_out_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        self.zoom_in_btn = QPushButton()
-        self.zoom_in_btn._base_icon = self._create_transparent_icon(
-            "zoom_in", icon_size, icon_color, 0.7
-        )
-        self.zoom_in_btn._hover_icon = create_professional_icon(
-            "zoom_in", icon_size, icon_color
-        )
-        self.zoom_in_btn.setIcon(self.zoom_in_btn._base_icon)
-        self.zoom_in_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Setup hover behavior for each button
-        for btn in [
-            self.prev_btn,
-            self.pause_btn,
-            self.stop_btn,
-            self.next_btn,
-            self.zoom_out_btn,
-            self.zoom_in_btn,
-        ]:
-            btn.enterEvent = lambda event, button=btn: self._on_button_enter(
-                event, button
-            )
-            btn.leaveEvent = lambda event, button=btn: self._on_button_leave(
-                event, button
-            )
-
-        # Connect signals
-        self.prev_btn.clicked.connect(self.previous_clicked.emit)
-        self.pause_btn.clicked.connect(self.pause_clicked.emit)
-        self.stop_btn.clicked.connect(self.stop_clicked.emit)
-        self.next_btn.clicked.connect(self.next_clicked.emit)
-        self.zoom_out_btn.clicked.connect(self.zoom_out_clicked.emit)
-        self.zoom_in_btn.clicked.connect(self.zoom_in_clicked.emit)
-
-        # Add buttons to layout (zoom buttons on the sides)
-        layout.addWidget(self.zoom_out_btn)
-        layout.addWidget(self.prev_btn)
-        layout.addWidget(self.pause_btn)
-        layout.addWidget(self.stop_btn)
-        layout.addWidget(self.next_btn)
-        layout.addWidget(self.zoom_in_btn)
+        # Create buttons with professional geometric icons; each gets a
+        # dimmed base icon and a full-opacity hover icon, swapped by
+        # eventFilter() on enter/leave
+        for attr, icon_type, signal_name in self._BUTTONS:
+            btn = QPushButton()
+            btn._base_icon, btn._hover_icon = _overlay_icons(icon_type)
+            btn.setIcon(btn._base_icon)
+            btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            btn.installEventFilter(self)
+            # Signal-to-signal, relayed by Qt without Python
+            btn.clicked.connect(getattr(self, signal_name))
+            setattr(self, attr, btn)
+            layout.addWidget(btn)
 
     def set_pause_state(self, is_paused, timer_active=True):
         """Update pause button based on timer state."""
-        from ..core.image_utils import create_professional_icon
-
         # If timer is not active, show play button regardless of pause state
         # If timer is active, show play when paused, pause when running
         icon_type = "play" if (not timer_active or is_paused) else "pause"
-        icon_size = 18  # Match the consistent icon size
-        icon_color = "#ffffff"
 
-        # Update both base and hover icons
-        self.pause_btn._base_icon = self._create_transparent_icon(
-            icon_type, icon_size, icon_color, 0.7
-        )
-        self.pause_btn._hover_icon = create_professional_icon(
-            icon_type, icon_size, icon_color
+        # Update both base and hover icons (cached, so toggling is cheap)
+        self.pause_btn._base_icon, self.pause_btn._hover_icon = _overlay_icons(
+            icon_type
         )
         self.pause_btn.setIcon(self.pause_btn._base_icon)
 
@@ -389,46 +497,37 @@ class ButtonOverlay(QWidget):
         super().show()
         self._start_auto_hide_timer()
 
-    def _create_transparent_icon(self, icon_type, size, color, opacity):
-        """Create an icon with specified opacity applied to the pixmap."""
-        from ..core.image_utils import create_professional_icon
-        from PySide6.QtGui import QIcon, QPixmap, QPainter
-
-        # Create the base icon
-        base_icon = create_professional_icon(icon_type, size, color)
-
-        # Get the pixmap and apply opacity
-        base_pixmap = base_icon.pixmap(size, size)
-        transparent_pixmap = QPixmap(size, size)
-        transparent_pixmap.fill(Qt.transparent)
-
-        painter = QPainter(transparent_pixmap)
-        painter.setOpacity(opacity)
-        painter.drawPixmap(0, 0, base_pixmap)
-        painter.end()
-
-        return QIcon(transparent_pixmap)
-
-    def _on_button_enter(self, event, button):
-        """Handle button hover - switch to full opacity icon."""
-        button.setIcon(button._hover_icon)
-
-    def _on_button_leave(self, event, button):
-        """Handle button leave - switch back to semi-transparent icon."""
-        button.setIcon(button._base_icon)
+    def eventFilter(self, watched, event):
+        """Swap a button to its full-opacity icon while hovered."""
+        if event.type() == QEvent.Enter:
+            watched.setIcon(watched._hover_icon)
+        elif event.type() == QEvent.Leave:
+            watched.setIcon(watched._base_icon)
+        return super().eventFilter(watched, event)
 
     def enterEvent(self, event):
         """Show controls when mouse enters the overlay."""
         super().enterEvent(event)
-        self._show_controls()
+        self._show_controls(force=True)
 
     def leaveEvent(self, event):
         """Start auto-hide timer when mouse leaves the overlay."""
         super().leaveEvent(event)
         self._start_auto_hide_timer()
 
-    def _show_controls(self):
-        """Show the controls and cancel auto-hide."""
+    def _show_controls(self, force=False):
+        """Show the controls and restart the auto-hide countdown.
+
+        Called for every (throttled) mouse move over the image, so unless
+        force is set this is a no-op while the controls are already up and
+        more than half of the hide delay is left.
+        """
+        if (
+            not force
+            and self.isVisible()
+            and self._hide_timer.remainingTime() > self._hide_delay // 2
+        ):
+            return
         self._hide_timer.stop()
         self._is_auto_hiding = False
         self._manually_hidden = False  # Reset manual hide when mouse moves
@@ -440,9 +539,10 @@ class ButtonOverlay(QWidget):
     def _start_auto_hide_timer(self):
         """Start or restart the auto-hide timer."""
         if not self._is_auto_hiding:
-            self._hide_timer.stop()
+            # start() restarts an active timer, no need to stop() it first
             self._hide_timer.start(self._hide_delay)
 
+    @Slot()
     def _auto_hide(self):
         """Hide the controls automatically."""
         self._is_auto_hiding = True
@@ -452,4 +552,4 @@ class ButtonOverlay(QWidget):
     def show_for_new_image(self):
         """Show controls explicitly for new image loading (resets manual hide state)."""
         self._manually_hidden = False  # Reset manual hide state
-        self._show_controls()
+        self._show_controls(force=True)
@@ -2,33 +2,38 @@
 """
 Simple import test for CI environments.
 Tests core functionality without requiring a GUI display.
+
+Run directly (``python test_imports.py``) or through pytest, which picks up
+``src`` from the ``pythonpath`` setting in pyproject.toml.
 """
 
 import sys
 import os
+from functools import cache
+
+
+@cache
+def _version():
+    """Return the app version, importing the version module only once."""
+    from version import get_version
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+    return get_version()
 
 
 def test_version():
     """Test version module."""
-    from version import get_version
-
-    version = get_version()
+    version = _version()
     print(f"Version: {version}")
     assert version.count(".") >= 2, "Version should be semantic (x.y.z)"
     print("Version test passed")
-    return version
 
 
 def test_core_imports():
     """Test core module imports."""
-    from version import get_version
     from core.image_utils import IMAGE_EXTENSIONS
 
     print("Core modules imported successfully")
-    print(f"Glimpse v{get_version()} - Core functionality verified")
+    print(f"Glimpse v{_version()} - Core functionality verified")
     print(f"Supported image formats: {len(IMAGE_EXTENSIONS)}")
 
 
@@ -36,20 +41,22 @@ def test_gui_imports():
     """Test GUI imports (requires display)."""
     try:
         from ui.main_window import GlimpseViewer  # noqa: F401
-        from version import get_version
 
         print("GUI imports successful")
-        print(f"Glimpse v{get_version()} - Full GUI test passed")
+        print(f"Glimpse v{_version()} - Full GUI test passed")
     except ImportError as e:
         print(f"GUI import failed: {e}")
         raise
 
 
 if __name__ == "__main__":
+    # Add src to path
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
     print("Running Glimpse import tests...")
 
     # Always test these
-    version = test_version()
+    test_version()
     test_core_imports()
 
     # Test GUI only if requested
@@ -59,4 +66,4 @@ if __name__ == "__main__":
     else:
         print("Skipping GUI tests (use --gui flag to enable)")
 
-    print(f"All tests passed for Glimpse v{version}!")
+    print(f"All tests passed for Glimpse v{_version()}!")
@@ -0,0 +1,65 @@
+import unittest
+
+from PySide6.QtCore import QCoreApplication, QPersistentModelIndex
+from PySide6.QtTest import QAbstractItemModelTester
+
+from src.core.collections import Collection
+from src.ui.components.collection_list_model import CollectionListModel
+
+
+def make_collections(*names):
+    return [Collection(name, [f"/images/{name}"]) for name in names]
+
+
+class TestCollectionListModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.model = CollectionListModel()
+        # Fails the test on any inconsistency between signals and rowCount()
+        self.tester = QAbstractItemModelTester(
+            self.model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+
+    def names(self):
+        return [
+            self.model.collection_at(row).name
+            for row in range(self.model.rowCount())
+            if self.model.collection_at(row) is not None
+        ]
+
+    def test_empty_shows_placeholder(self):
+        self.model.set_collections([])
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertIsNone(self.model.collection_at(0))
+
+    def test_leave_and_enter_placeholder(self):
+        self.model.set_collections(make_collections("a", "b"))
+        self.assertEqual(self.names(), ["a", "b"])
+        self.model.set_collections([])
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.names(), [])
+
+    def test_replace_all_rows(self):
+        # e.g. renaming the only collection
+        self.model.set_collections(make_collections("old"))
+        self.model.set_collections(make_collections("new", "other"))
+        self.assertEqual(self.names(), ["new", "other"])
+
+    def test_remove_insert_and_reorder(self):
+        self.model.set_collections(make_collections("a", "b", "c"))
+        self.model.set_collections(make_collections("d", "c", "a"))
+        self.assertEqual(self.names(), ["d", "c", "a"])
+        self.assertEqual(self.model.row_for_name("a"), 2)
+
+    def test_reorder_keeps_persistent_index(self):
+        self.model.set_collections(make_collections("a", "b", "c"))
+        persistent = QPersistentModelIndex(self.model.index(0))
+        self.model.set_collections(make_collections("c", "b", "a"))
+        self.assertEqual(persistent.row(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()